@@ -22,16 +22,23 @@
 from woob.browser.pages import HTMLPage
 
 
+FIX_FORM_KEYS = (
+    'MM$HISTORIQUE_COMPTE$btnCumul', 'Cartridge$imgbtnMessagerie', 'MM$m_CH$ButtonImageFondMessagerie',
+    'MM$m_CH$ButtonImageMessagerie',
+)
+
+
 def fix_form(form):
-    keys = [
-        'MM$HISTORIQUE_COMPTE$btnCumul', 'Cartridge$imgbtnMessagerie', 'MM$m_CH$ButtonImageFondMessagerie',
-        'MM$m_CH$ButtonImageMessagerie',
-    ]
-    for name in keys:
+    for name in FIX_FORM_KEYS:
         form.pop(name, None)
 
 
 class BasePage(HTMLPage):
+    # Accounts pages of professional users can be really big: allow huge trees,
+    # and as we never look for elements by their id through lxml, do not let the
+    # parser build the id lookup table.
+    PARSER_OPTIONS = {'collect_ids': False, 'huge_tree': True}
+
     def build_doc(self, content):
         # don't know if it's still relevant...
         content = content.strip(b'\x00')
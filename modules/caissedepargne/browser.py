@@ -36,6 +36,7 @@
 from woob.capabilities.bank import (
     Account, AccountOwnerType,
 )
+from woob.capabilities.base import NotLoaded
 from woob.exceptions import (
     ActionNeeded, ActionType, AppValidation, AppValidationExpired,
     AuthMethodNotImplemented, BrowserIncorrectPassword, BrowserQuestion,
@@ -482,6 +483,8 @@ def raise_otp_emv_authentication(self, *params):
                 # The first one with authentication values and second one with vk values
                 doc['step'] = self.page.doc
                 self.page.doc = doc
+                # validation units were read from the replaced doc
+                self.page._validation_unit = NotLoaded
                 return self.do_vk_authentication(*params)
 
             # Need fresh id values to do EMV authentication again
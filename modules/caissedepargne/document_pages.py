@@ -17,6 +17,7 @@
 
 # flake8: compatible
 
+from lxml import etree
 
 from woob.browser.elements import ItemElement, method, TableElement
 from woob.browser.filters.html import Link, TableCell
@@ -74,7 +75,8 @@ def condition(self):
 
             obj_id = Format('%s_%s', Env('subid'), Field('date'))
             obj_date = Date(CleanText(TableCell('date')), dayfirst=True)
-            obj_label = CleanText(TableCell('type'))
+            # the condition already read the type cell, only statements are kept
+            obj_label = 'Relevé de comptes'
             obj_type = DocumentTypes.STATEMENT
             obj_format = 'pdf'
-            obj__event_target = Regexp(Link('./td[6]//a'), r'WebForm_PostBackOptions\("(.*?)",')
+            obj__event_target = Regexp(Link(etree.XPath('./td[6]//a')), r'WebForm_PostBackOptions\("(.*?)",')
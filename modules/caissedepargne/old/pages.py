@@ -18,11 +18,13 @@
 # flake8: compatible
 
 import re
-from collections import OrderedDict
+from collections import defaultdict
+from itertools import chain
 from decimal import Decimal
 from datetime import datetime
 from urllib.parse import urljoin
 
+from lxml import etree
 from requests.cookies import remove_cookie_by_name
 
 from woob.browser.pages import (
@@ -32,10 +34,10 @@
 from woob.browser.elements import ItemElement, method, ListElement, TableElement, SkipItem, DictElement
 from woob.browser.filters.standard import (
     Date, CleanDecimal, Regexp, CleanText, Env,
-    Field, Eval, Format, Currency, Coalesce, MapIn,
+    Field, Eval, Format, Currency, MapIn,
     Lower,
 )
-from woob.browser.filters.html import Link, Attr, TableCell
+from woob.browser.filters.html import Link, Attr, TableCell, HasElement
 from woob.capabilities.base import NotAvailable, empty
 from woob.capabilities.bank import (
     Account, Loan, AccountOwnership,
@@ -54,6 +56,56 @@
 from ..base_pages import fix_form, BasePage
 
 
+ACCOUNT_LINK_RE = re.compile(
+    r"PostBack(Options)?\([\"'][^\"']+[\"'],\s*['\"]([HISTORIQUE_\w|SYNTHESE_ASSURANCE_CNP|BOURSE|COMPTE_TITRE][\d\w&]+)?['\"]"
+)
+ACCOUNT_TITLE_ID_RE = re.compile(r"([\d]+)")
+MEASURE_ACCOUNT_NUMBER_RE = re.compile(r'[A-Z]*\d{3,}')
+# matches for example '106 100,64'
+MEASURE_BALANCE_RE = re.compile(r'\s\d{1,3}(?:[\s.,]\d{3})*(?:[\s.,]\d{2})')
+MEASURE_ID_RE = re.compile(r"(\d{4,})")
+# ex: PERIC123456, PERCE312312, ESSEN789789 OR INFI2000000, ESSE2111111
+NATIXIS_ACCOUNT_NUMBER_RE = re.compile(r'([A-Z]{3})([A-Z]{2}|[A-Z]{1}[0-9]{1})(\d{6})')
+SPACES_RE = re.compile(r'[ ]+')
+DEBIT_DATE_RE = re.compile(r'\b(\d{2}/\d{2}/\d{4})\b')
+CARD_NUMBER_RE = re.compile(r'(Cb|CB) (\d{4}\*+\d{6}) ')
+# a title (M, MR, ME, MME, MLLE, MLE or ML) somewhere before "OU <title>",
+# applied on the upper-cased owner cell
+CO_OWNERS_RE = re.compile(r'M.*\bOU M(?:R|E|ME|LLE|LE|L)?\b')
+GO_BACK_LINK_RE = re.compile(r'\(~deibaseurl\)(.*)$')
+CARD_DETAIL_LINK_RE = re.compile(r'.*\("(.*)", "(DETAIL_OP&[\d]+).*\)\)')
+HISTORY_ACCOUNT_TYPE_RE = re.compile(r'HISTORIQUE_(\w+)')
+LIFE_INSURANCE_POSTBACK_RE = re.compile(
+    r"PostBackOptions?\([\"']([^\"']+)[\"'],\s*['\"]((REDIR_ASS_VIE)?[\d\w&]+)?['\"]"
+)
+TRANSFER_POSTBACK_RE = re.compile(r"PostBackOptions?\([\"']([^\"']+)[\"'],\s*['\"]([^\"']+)?['\"]")
+MASKED_CARD_NUMBER_RE = re.compile(r'(\d{4,6}X{6}\d{4,6})')
+# the stars or the 'X' are not at the same position for sub-modules such as palatine
+CARD_COMING_NUMBER_RE = re.compile(r'(\d{6}\*{6}\d{4}|\d{4}\*{6}\d{6})')
+CARD_COMING_ID_RE = re.compile(r'(\d{4}X{6}\d{6}|\d{6}X{6}\d{4})')
+CARD_HOLDER_NAME = Regexp(
+    pattern=r"(Visa|VISA) (?:Classic|CLASSIC|Premier|PREMIER|Infinite|INFINITE|Platinum|PLATINUM|(Gold\s)*Business) (?:Izicarte )?((?:MME|ME|Mme|MR|M|M\.|MLLE|MLE|ML|LE|DD|N)?[a-zA-Zéèî,\- .]+) \d+[*]+\d+"
+)
+CARD_COMING_LINK_RE = re.compile(r'.*(DETAIL_OP_M\d&[^\"]+).*')
+CARD_ACCOUNT_ID_RE = re.compile(r'.*(\d{11}).*')
+CARD_COMING_TITLE_DATE_RE = re.compile('.*le (.*) sur .*')
+CARD_COMING_EVENTARGUMENT_RE = re.compile(r'.*(DETAIL_OP_M0\&.*;\d{8})", .*')
+TRUSTED_DEVICE_URL_RE = re.compile(r'if\("([^"]+(?:trusted-device)[^"]+)"')
+HISTORY_EVENTTARGET_RE = re.compile(r'.*\([\'\"](MM\$.*?)[\'\"],.*\)$')
+
+# Decimal instances are immutable, the same one can be set on every card parent account
+ZERO_COMING = Decimal('0.0')
+
+# Filters applied on each cell of the accounts and loans tables, built only once
+CLEAN_TEXT = CleanText('.')
+CLEAN_STRONG_TEXT = CleanText(etree.XPath('.//strong'))
+CLEAN_SOMME_TEXT = CleanText(etree.XPath('.//td[has-class("somme")]'))
+CLEAN_LINK_TEXT = CleanText(etree.XPath('./a'))
+CLEAN_LOAN_LABEL = CleanText(etree.XPath('(.//a/strong)[1]'), children=False)
+CLEAN_CARD_OPTIONS = CleanText(etree.XPath('./td[5]'))
+LOAN_POPIN_LINK = Link(etree.XPath('./td/a[contains(@id, "IdPopinLink")]'), default=None)
+
+
 def MyDecimal(*args, **kwargs):
     kwargs.update(replace_dots=True)
     return CleanDecimal(*args, **kwargs)
@@ -81,7 +133,7 @@ def on_load(self):
 
         if go_back_link is not NotAvailable:
             assert len(go_back_link) != 1
-            go_back_link = re.search(r'\(~deibaseurl\)(.*)$', go_back_link).group(1)
+            go_back_link = GO_BACK_LINK_RE.search(go_back_link).group(1)
 
             self.browser.location('%s%s' % (self.browser.BASEURL, go_back_link))
 
@@ -108,6 +160,21 @@ def check_no_accounts(self):
             raise NoAccountsException(no_account_message)
 
 
+class MainFormCache:
+    """Postbacks of the old website all go through the <form id="main">"""
+
+    _main_form_el = None
+
+    def get_main_form(self):
+        # Callers fill the returned form, so only the <form> lookup is cached,
+        # a fresh Form is built on each call.
+        if self._main_form_el is None:
+            self._main_form_el = self.doc.find('.//form[@id="main"]')
+            if self._main_form_el is None:
+                raise FormNotFound()
+        return self.FORM_CLASS(self, self._main_form_el)
+
+
 class Transaction(FrenchTransaction):
     PATTERNS = [
         (
@@ -155,7 +222,7 @@ class Transaction(FrenchTransaction):
     ]
 
 
-class IndexPage(LoggedPage, BasePage, NoAccountCheck):
+class IndexPage(LoggedPage, BasePage, NoAccountCheck, MainFormCache):
     ACCOUNT_TYPES = {
         'Epargne liquide': Account.TYPE_SAVINGS,
         'Compte Courant': Account.TYPE_CHECKING,
@@ -214,6 +281,69 @@ class IndexPage(LoggedPage, BasePage, NoAccountCheck):
         'professionnel': AccountOwnerType.ORGANIZATION,
     }
 
+    # XPath expressions used on every accounts and history page, compiled only once
+    INACTIVE_ACCOUNT_XPATH = etree.XPath('//tr[td[contains(text(), $id)]][@class="Inactive"]')
+    OLD_WEBSITE_TABLES_XPATH = etree.XPath('//table[@cellpadding="1"]')
+    OLD_WEBSITE_ROWS_XPATH = etree.XPath('//table[@cellpadding="1"]/tr')
+    OLD_WEBSITE_MEASURE_ROWS_XPATH = etree.XPath('//table[@cellpadding="1"]/tr[not(@class)]')
+    OLD_WEBSITE_LOAN_ROWS_XPATH = etree.XPath('//table[@cellpadding="1"]/tr[not(@class) and td[a]]')
+    PANELS_XPATH = etree.XPath('//div[@class="panel"]')
+    PANEL_ACCOUNT_ROWS_XPATH = etree.XPath('.//tr[@class!="en-tetes" and @class!="Inactive"]')
+    PANEL_LOAN_ROWS_XPATH = etree.XPath(
+        './table/tbody/tr[contains(@id,"MM_SYNTHESE_CREDITS") and contains(@id,"IdTrGlobal")]'
+    )
+    LOAN_BALANCE_HEADER_XPATH = etree.XPath(
+        './preceding-sibling::tr[@class="en-tetes"]/th[contains(text(), "Capital restant dû")]'
+    )
+    LOAN_BALANCE_COLUMN_XPATH = etree.XPath(
+        'count(./preceding-sibling::tr[@class="en-tetes"]/th[contains(text(), "Capital restant dû")]/preceding-sibling::*)'
+    )
+    LOAN_DETAIL_VALUE_XPATHS = {
+        name: etree.XPath('.//div[contains(@id, "_IdDivDetail_")]//tr[contains(@id, "_Id%s_")]/td' % name)
+        for name in (
+            'CapitalEmprunte', 'Taux', 'DateOuverture', 'DateSignature',
+            'DerniereEcheance', 'MontantEcheance', 'DateProchaineEcheance',
+        )
+    }
+    LIFE_INSURANCE_BALANCE_XPATH = etree.XPath(
+        './/tr[td[contains(@id,"NumContrat")]]/td[@class="somme"]/a[contains(@href, $id)]'
+    )
+    OTHER_LIFE_INSURANCE_BALANCE_XPATH = etree.XPath('//tr[td[contains(text(), $id)]]/td/div[contains(@id, "Solde")]')
+    HISTORY_ROWS_XPATH = etree.XPath('//tr[@class="rowClick" or @class="rowHover"]')
+    CARD_DEBIT_DATE_XPATH = etree.XPath(
+        '//span[@id="MM_HISTORIQUE_CB_m_TableTitle3_lblTitle"] | //label[contains(text(), "débiter le")]'
+    )
+    NEXT_PAGE_LINK_XPATH = etree.XPath('//a[contains(@id, "lnkSuivante")]')
+
+    # XPath expressions of the availability checks, compiled only once
+    PARTIAL_ACCOUNTS_ERROR_XPATH = etree.XPath('//div[@id="MM_SYNTHESE_CREDITS_divPopinInfoIndispo"]//p[1]')
+    TRANSFER_LINK_XPATH = etree.XPath(
+        '//a[span[contains(text(), "Effectuer un virement")]] | //a[contains(text(), "Réaliser un virement")]'
+    )
+    TRANSFER_UNAVAILABLE_XPATH = etree.XPath(
+        '//li[contains(text(), "Pour accéder à cette fonctionnalité, vous devez disposer d’un moyen d’authentification renforcée")]'
+    )
+    LOAN_UNAVAILABLE_XPATH = etree.XPath(
+        '//span[@id="MM_LblMessagePopinError"] | //p[@id="MM_ERREUR_PAGE_BLANCHE_pAlert"]'
+    )
+    CONTENT_MAIN_XPATH = etree.XPath('//div[@id="MM_ContentMain"]')
+    EMAIL_NEEDED_XPATH = etree.XPath('//span[contains(@id, "NonEligibleRenseignerEmail")]')
+    NO_THIRD_PARTY_ACCOUNT_XPATH = etree.XPath('//ul/li[contains(text(), "Aucun compte tiers n\'est disponible")]')
+    HISTORY_ACCOUNT_SELECT_XPATH = etree.XPath('//select[@id="MM_HISTORIQUE_COMPTE_m_ExDropDownList"]')
+    SELECTED_OPTION_XPATH = etree.XPath('//option[@value=$id and @selected]')
+    TRUSTED_DEVICE_SCRIPTS_XPATH = etree.XPath('//script[contains(text(), "trusted-device")]/text()')
+    # new website | old website
+    LEVIES_LINK_XPATH = etree.XPath(
+        '//a/span[contains(text(), "Suivre mes prélèvements reçus")] | //a[contains(text(), "Suivre les prélèvements reçus")]'
+    )
+
+    _measure_numbers = None
+
+    QCF_EXPECTED_RE = re.compile('|'.join(re.escape(message) for message in (
+        "investissement financier (QCF) n’est plus valide à ce jour ou que vous avez refusé d’y répondre",
+        "expérience en matière d'instruments financiers n'est plus valide ou n’a pas pu être déterminé",
+    )))
+
     def on_load(self):
 
         # For now, we have to handle this because after this warning message,
@@ -227,11 +357,7 @@ def on_load(self):
                 self.browser.location(link)
             else:
                 message = CleanText('//span[contains(@id, "QCF")]/p')(self.doc)
-                expected = (
-                    "investissement financier (QCF) n’est plus valide à ce jour ou que vous avez refusé d’y répondre",
-                    "expérience en matière d'instruments financiers n'est plus valide ou n’a pas pu être déterminé",
-                )
-                if any(e in message for e in expected):
+                if self.QCF_EXPECTED_RE.search(message):
                     raise ActionNeeded(message)
                 raise AssertionError('Unhandled error while going to market space: %s' % message)
 
@@ -277,11 +403,8 @@ def find_and_replace(self, info, acc_id):
                 info['id'] = info['id'].replace(sub_part, acc_id)
                 return
 
-    def _get_account_info(self, a, accounts):
-        m = re.search(
-            r"PostBack(Options)?\([\"'][^\"']+[\"'],\s*['\"]([HISTORIQUE_\w|SYNTHESE_ASSURANCE_CNP|BOURSE|COMPTE_TITRE][\d\w&]+)?['\"]",
-            a.attrib.get('href', '')
-        )
+    def _get_account_info(self, a, accounts, accounts_keys):
+        m = ACCOUNT_LINK_RE.search(a.attrib.get('href', ''))
 
         if m is None:
             return None
@@ -290,41 +413,42 @@ def _get_account_info(self, a, accounts):
             # and is necessary for navigation.
             link = m.group(2)
             parts = link.split('&')
-            info = {}
-            info['link'] = link
-            id = re.search(r"([\d]+)", a.attrib.get('title', ''))
+            id = ACCOUNT_TITLE_ID_RE.search(a.attrib.get('title', ''))
             if len(parts) > 1:
-                info['type'] = parts[0]
-                if info['type'] in ('REDIR_ASS_VIE', 'NA_WEB'):
+                if parts[0] in ('REDIR_ASS_VIE', 'NA_WEB'):
                     # The link format for these account types has an additional parameter
-                    info['id'] = info['_id'] = parts[2]
+                    account_id = parts[2]
                 else:
-                    info['id'] = info['_id'] = parts[1]
-                if id or info['id'] in [acc._info['_id'] for acc in accounts.values()]:
-                    if id:
-                        _id = id.group(1)
-                    else:
-                        unique_ids = {k for k, v in accounts.items() if info['id'] == v._info['_id']}
-                        _id = list(unique_ids)[0]
-                    self.find_and_replace(info, _id)
+                    account_id = parts[1]
+                info = {'link': link, 'type': parts[0], 'id': account_id, '_id': account_id}
+                if id:
+                    self.find_and_replace(info, id.group(1))
+                else:
+                    # accounts_keys may still reference accounts that have since been
+                    # replaced in accounts, so double check their '_id'
+                    unique_ids = {
+                        k for k in accounts_keys.get(info['id'], ())
+                        if accounts[k]._info['_id'] == info['id']
+                    }
+                    if unique_ids:
+                        self.find_and_replace(info, list(unique_ids)[0])
             else:
                 if id is None:
                     return None
-                info['type'] = link
-                info['id'] = info['_id'] = id.group(1)
+                info = {'link': link, 'type': link, 'id': id.group(1), '_id': id.group(1)}
             account_type = self.ACCOUNT_TYPES_LINK.get(info['type'])
             if account_type:
                 info['acc_type'] = account_type
             return info
 
     def is_account_inactive(self, account_id):
-        return self.doc.xpath('//tr[td[contains(text(), $id)]][@class="Inactive"]', id=account_id)
+        return self.INACTIVE_ACCOUNT_XPATH(self.doc, id=account_id)
 
     def _add_account(
-        self, accounts, link, label, account_type, balance, number=None,
+        self, accounts, accounts_keys, link, label, account_type, balance, number=None,
         ownership=NotAvailable, owner_type=NotAvailable
     ):
-        info = self._get_account_info(link, accounts)
+        info = self._get_account_info(link, accounts, accounts_keys)
         if info is None:
             self.logger.warning('Unable to parse account %r: %r' % (label, link))
             return
@@ -368,59 +492,60 @@ def _add_account(
         account._card_links = []
 
         # Set coming history link to the parent account. At this point, we don't have card account yet.
-        if account._info['type'] == 'HISTORIQUE_CB' and account.id in accounts:
-            a = accounts[account.id]
-            a.coming = Decimal('0.0')
-            a._card_links = account._info
-            return
+        if account._info['type'] == 'HISTORIQUE_CB':
+            a = accounts.get(account.id)
+            if a is not None:
+                a.coming = ZERO_COMING
+                a._card_links = account._info
+                return
 
         accounts[account.id] = account
+        accounts_keys[info['_id']].add(account.id)
         return account
 
     def get_balance(self, account):
         if account.type not in (Account.TYPE_LIFE_INSURANCE, Account.TYPE_PERP, Account.TYPE_CAPITALISATION):
             return NotAvailable
         page = self.go_history(account._info).page
-        balance = page.doc.xpath(
-            './/tr[td[contains(@id,"NumContrat")]]/td[@class="somme"]/a[contains(@href, $id)]',
-            id=account.id
+        balance = (
+            self.LIFE_INSURANCE_BALANCE_XPATH(page.doc, id=account.id)
+            # Specific xpath for some Life Insurances:
+            or self.OTHER_LIFE_INSURANCE_BALANCE_XPATH(page.doc, id=account.id)
         )
-        if len(balance) > 0:
-            balance = CleanText('.')(balance[0])
-            if balance == '':
-                balance = NotAvailable
+        if balance:
+            balance = CLEAN_TEXT(balance[0]) or NotAvailable
         else:
-            # Specific xpath for some Life Insurances:
-            balance = page.doc.xpath('//tr[td[contains(text(), $id)]]/td/div[contains(@id, "Solde")]', id=account.id)
-            if len(balance) > 0:
-                balance = CleanText('.')(balance[0])
-                if balance == '':
-                    balance = NotAvailable
-            else:
-                # sometimes the accounts are attached but no info is available
-                balance = NotAvailable
+            # sometimes the accounts are attached but no info is available
+            balance = NotAvailable
         self.go_list()
         return balance
 
+    def get_measure_numbers(self):
+        # The rows are parsed only once per page, whatever the number of accounts we look for
+        if self._measure_numbers is None:
+            self._measure_numbers = []
+            for tr in self.OLD_WEBSITE_MEASURE_ROWS_XPATH(self.doc):
+                account_number = CleanText('./td/a[contains(@class, "NumeroDeCompte")]')(tr)
+                self._measure_numbers.append((MEASURE_ACCOUNT_NUMBER_RE.search(account_number), account_number))
+        return self._measure_numbers
+
     def get_measure_balance(self, account):
-        for tr in self.doc.xpath('//table[@cellpadding="1"]/tr[not(@class)]'):
-            account_number = CleanText('./td/a[contains(@class, "NumeroDeCompte")]')(tr)
-            if re.search(r'[A-Z]*\d{3,}', account_number).group() in account.id:
-                # The regex '\s\d{1,3}(?:[\s.,]\d{3})*(?:[\s.,]\d{2})' matches for example '106 100,64'
-                return re.search(r'\s\d{1,3}(?:[\s.,]\d{3})*(?:[\s.,]\d{2})', account_number).group()
+        for number_match, account_number in self.get_measure_numbers():
+            if number_match.group() in account.id:
+                return MEASURE_BALANCE_RE.search(account_number).group()
         return NotAvailable
 
     def get_measure_ids(self):
         accounts_id = []
         for a in self.doc.xpath('//table[@cellpadding="1"]/tr/td[2]/a'):
-            accounts_id.append(re.search(r"(\d{4,})", Attr('.', 'href')(a)).group(1))
+            accounts_id.append(MEASURE_ID_RE.search(Attr('.', 'href')(a)).group(1))
         return accounts_id
 
     def has_next_page(self):
         return self.doc.xpath('//div[@id="MM_SYNTHESE_MESURES_m_DivLinksPrecSuiv"]//a[contains(text(), "Page suivante")]')
 
     def goto_next_page(self):
-        form = self.get_form(id="main")
+        form = self.get_main_form()
 
         form['__EVENTTARGET'] = 'MM$SYNTHESE_MESURES$lnkSuivante'
         form['__EVENTARGUMENT'] = ''
@@ -429,46 +554,53 @@ def goto_next_page(self):
         form.submit()
 
     def get_list(self, owner_name):
-        accounts = OrderedDict()
+        accounts = {}
+        # keys of `accounts` indexed by the '_id' of their info, to avoid
+        # scanning all the accounts already found for each parsed link
+        accounts_keys = defaultdict(set)
+        owner_names = owner_name.split()
+        get_account_type = self.ACCOUNT_TYPES.get
 
         # Old website
         self.browser.new_website = False
-        for table in self.doc.xpath('//table[@cellpadding="1"]'):
+        for table in self.OLD_WEBSITE_TABLES_XPATH(self.doc):
             account_type = Account.TYPE_UNKNOWN
             owner_type = self.get_owner_type(table.attrib.get('id'))
 
-            for tr in table.xpath('./tr'):
+            for tr in table.findall('tr'):
                 tds = tr.findall('td')
                 if tr.attrib.get('class', '') == 'DataGridHeader':
                     account_type = (
-                        self.ACCOUNT_TYPES.get(tds[1].text.strip())
-                        or self.ACCOUNT_TYPES.get(CleanText('.')(tds[2]))
-                        or self.ACCOUNT_TYPES.get(CleanText('.')(tds[3]), Account.TYPE_UNKNOWN)
+                        get_account_type(tds[1].text.strip())
+                        or get_account_type(CLEAN_TEXT(tds[2]))
+                        or get_account_type(CLEAN_TEXT(tds[3]), Account.TYPE_UNKNOWN)
                     )
                 else:
                     # On the same row, there could have many accounts (check account and a card one).
                     # For the card line, the number will be the same than the checking account, so we skip it.
-                    ownership = self.get_ownership(tds, owner_name)
+                    ownership = self.get_ownership(tds, owner_names)
                     if len(tds) > 4:
-                        for i, a in enumerate(tds[2].xpath('./a')):
-                            label = CleanText('.')(a)
-                            balance = CleanText('.')(tds[-2].xpath('./a')[i])
+                        balance_links = tds[-2].findall('a')
+                        for i, a in enumerate(tds[2].findall('a')):
+                            label = CLEAN_TEXT(a)
+                            balance = CLEAN_TEXT(balance_links[i])
                             number = None
                             # if i > 0, that mean it's a card account. The number will be the same than it's
                             # checking parent account, we have to skip it.
                             if i == 0:
-                                number = CleanText('.')(tds[-4].xpath('./a')[0])
+                                number = CLEAN_TEXT(tds[-4].findall('a')[0])
                             self._add_account(
-                                accounts, a, label, account_type, balance, number,
+                                accounts, accounts_keys, a, label, account_type, balance, number,
                                 ownership=ownership, owner_type=owner_type
                             )
                     # Only 4 tds on "banque de la reunion" website.
                     elif len(tds) == 4:
-                        for i, a in enumerate(tds[1].xpath('./a')):
-                            label = CleanText('.')(a)
-                            balance = CleanText('.')(tds[-1].xpath('./a')[i])
+                        balance_links = tds[-1].findall('a')
+                        for i, a in enumerate(tds[1].findall('a')):
+                            label = CLEAN_TEXT(a)
+                            balance = CLEAN_TEXT(balance_links[i])
                             self._add_account(
-                                accounts, a, label, account_type, balance,
+                                accounts, accounts_keys, a, label, account_type, balance,
                                 ownership=ownership, owner_type=owner_type
                             )
 
@@ -481,12 +613,12 @@ def get_list(self, owner_name):
             # New website
             self.browser.new_website = True
             owner_type = self.get_owner_type()
-            for table in self.doc.xpath('//div[@class="panel"]'):
+            for table in self.PANELS_XPATH(self.doc):
                 title = table.getprevious()
                 if title is None:
                     continue
-                account_type = self.ACCOUNT_TYPES.get(CleanText('.')(title), Account.TYPE_UNKNOWN)
-                for tr in table.xpath('.//tr[@class!="en-tetes" and @class!="Inactive"]'):
+                account_type = get_account_type(CLEAN_TEXT(title), Account.TYPE_UNKNOWN)
+                for tr in self.PANEL_ACCOUNT_ROWS_XPATH(table):
                     tds = tr.findall('td')
                     for i in range(len(tds)):
                         a = tds[i].find('.//a')
@@ -498,38 +630,33 @@ def get_list(self, owner_name):
 
                     # sometimes there's a tooltip span to ignore next to <strong>
                     # (perhaps only on creditcooperatif)
-                    label = CleanText('.//strong')(tds[0])
-                    balance = CleanText('.//td[has-class("somme")]')(tr)
-                    ownership = self.get_ownership(tds, owner_name)
+                    label = CLEAN_STRONG_TEXT(tds[0])
+                    balance = CLEAN_SOMME_TEXT(tr)
+                    ownership = self.get_ownership(tds, owner_names)
                     account = self._add_account(
-                        accounts, a, label, account_type, balance,
+                        accounts, accounts_keys, a, label, account_type, balance,
                         ownership=ownership, owner_type=owner_type
                     )
                     if account:
-                        account.number = CleanText('.')(tds[1])
+                        account.number = CLEAN_TEXT(tds[1])
 
                         # for natixis accounts, the number is also the REST api path
                         # leading to the natixis account seen as a REST resource
                         account._natixis_url_path = None
-                        m = re.search(
-                            r'([A-Z]{3})([A-Z]{2}|[A-Z]{1}[0-9]{1})(\d{6})', account.number
-                        )  # ex: PERIC123456, PERCE312312, ESSEN789789 OR INFI2000000, ESSE2111111
+                        m = NATIXIS_ACCOUNT_NUMBER_RE.search(account.number)
                         if m:
                             account._natixis_url_path = '/{}/{}/{}'.format(*m.groups())
         return list(accounts.values())
 
-    def get_ownership(self, tds, owner_name):
+    def get_ownership(self, tds, owner_names):
         if len(tds) > 2:
-            account_owner = CleanText('.', default=None)(tds[2]).upper()
-            if account_owner and any(title in account_owner for title in ('M', 'MR', 'MLLE', 'MLE', 'MME')):
-                pattern = re.compile(
-                    r'(m|mr|me|mme|mlle|mle|ml)\.? ?(.*)\bou (m|mr|me|mme|mlle|mle|ml)\b(.*)',
-                    re.IGNORECASE
-                )
-
-                if pattern.search(account_owner):
+            account_owner = CLEAN_TEXT(tds[2]).upper()
+            # All the titles ('M', 'MR', 'MLLE', 'MLE', 'MME') contain a 'M'
+            if account_owner and 'M' in account_owner:
+                # Most rows have a single owner, do not bother with the regex without any 'OU'
+                if 'OU ' in account_owner and CO_OWNERS_RE.search(account_owner):
                     return AccountOwnership.CO_OWNER
-                elif all(n in account_owner for n in owner_name.split()):
+                elif all(n in account_owner for n in owner_names):
                     return AccountOwnership.OWNER
                 return AccountOwnership.ATTORNEY
         return NotAvailable
@@ -580,7 +707,7 @@ def prepare_form_cons_or_revolving(self, tr, loan):
             pattern,
         )(tr)
 
-        form = self.get_form(id="main")
+        form = self.get_main_form()
 
         eventargument = f'{form_argument}{argument_id}'
         eventtarget = 'MM$SYNTHESE_CREDITS'
@@ -595,7 +722,7 @@ def prepare_form_old_loan_website(self, td):
             default=None,
         )(td)
 
-        form = self.get_form(id="main")
+        form = self.get_main_form()
 
         eventargument = argument
         scriptmanager = 'MM$m_UpdatePanel|MM$SYNTHESE_CREDITS'
@@ -632,23 +759,25 @@ class fill_old_loan(ItemElement):
         )
 
     def get_loan_list(self):
-        accounts = OrderedDict()
+        accounts = {}
 
         # Old website
-        for tr in self.doc.xpath('//table[@cellpadding="1"]/tr[not(@class) and td[a]]'):
+        for tr in self.OLD_WEBSITE_LOAN_ROWS_XPATH(self.doc):
             tds = tr.findall('td')
 
-            if 'Veuillez contacter le Crédit Bailleur' in CleanText('./a')(tds[4]):
+            balance_text = CLEAN_LINK_TEXT(tds[4])
+            if 'Veuillez contacter le Crédit Bailleur' in balance_text:
                 # balance not available, we skip the account
                 continue
 
             account = Loan()
             account._card_links = None
-            account.id = account.number = CleanText('./a')(tds[2]).split('-')[0].strip()
-            account.label = CleanText('./a')(tds[2]).split('-')[-1].strip()
+            link_text = CLEAN_LINK_TEXT(tds[2])
+            account.id = account.number = link_text.split('-')[0].strip()
+            account.label = link_text.split('-')[-1].strip()
             account.type = MapIn(None, self.ACCOUNT_TYPES, Account.TYPE_UNKNOWN).filter(Lower().filter(account.label))
             account.balance = -CleanDecimal('./a', replace_dots=True)(tds[4])
-            account.currency = account.get_currency(CleanText('./a')(tds[4]))
+            account.currency = account.get_currency(balance_text)
             account.owner_type = self.get_owner_type(tr.attrib.get('id'))
             account._form_params = self.prepare_form_old_loan_website(tds[2])
 
@@ -670,24 +799,25 @@ def get_loan_list(self):
         if website == 'new':
             # New website
             owner_type = self.get_owner_type()
-            for table in self.doc.xpath('//div[@class="panel"]'):
+            for table in self.PANELS_XPATH(self.doc):
                 title = table.getprevious()
                 if title is None:
                     continue
-                account_type = self.ACCOUNT_TYPES.get(CleanText('.')(title), Account.TYPE_UNKNOWN)
+                title_text = CLEAN_TEXT(title)
+                account_type = self.ACCOUNT_TYPES.get(title_text, Account.TYPE_UNKNOWN)
 
-                for tr in table.xpath('./table/tbody/tr[contains(@id,"MM_SYNTHESE_CREDITS") and contains(@id,"IdTrGlobal")]'):
+                for tr in self.PANEL_LOAN_ROWS_XPATH(table):
                     tds = tr.findall('td')
                     if not tds:
                         continue
-                    label = CleanText('(.//a/strong)[1]', children=False)(tds[0])
+                    label = CLEAN_LOAN_LABEL(tds[0])
 
                     # The balance column is not always in the same position for children modules.
                     # So check for it's position by name. If not finding, we do it the old way, using the last column.
                     # We search at tr level to avoid fetching balance column in previous sections of the table.
-                    balance_col_exist = bool(tr.xpath('./preceding-sibling::tr[@class="en-tetes"]/th[contains(text(), "Capital restant dû")]'))
+                    balance_col_exist = bool(self.LOAN_BALANCE_HEADER_XPATH(tr))
                     if balance_col_exist:
-                        balance_col_id = int(tr.xpath('count(./preceding-sibling::tr[@class="en-tetes"]/th[contains(text(), "Capital restant dû")]/preceding-sibling::*)'))
+                        balance_col_id = int(self.LOAN_BALANCE_COLUMN_XPATH(tr))
                         balance = CleanDecimal.French('.', sign='-')(tds[balance_col_id])
                     else:
                         balance = CleanDecimal.French('.', sign='-')(tds[-1])
@@ -697,7 +827,7 @@ def get_loan_list(self):
 
                         if (
                             available
-                            and not any(cls in Attr('.', 'id')(tr) for cls in ['dgImmo', 'dgConso'])
+                            and not any(cls in tr.get('id') for cls in ['dgImmo', 'dgConso'])
                         ):
                             # In case of Consumer credit or revolving credit, we add available amount with max amount
                             # (which is negative) to get what was spend. Example: 'Disponible' -> available = +8000,
@@ -709,7 +839,7 @@ def get_loan_list(self):
                     account.label = label
                     account.type = account_type
                     account.balance = balance
-                    account.currency = account.get_currency(CleanText('.')(tds[-1]))
+                    account.currency = account.get_currency(CLEAN_TEXT(tds[-1]))
                     account.owner_type = owner_type
                     account._card_links = []
                     # The website doesn't show any information relative to the loan
@@ -718,45 +848,45 @@ def get_loan_list(self):
 
                     # Loans details are on the current page
                     if (
-                        'immobiliers' in CleanText('.')(title)
+                        'immobiliers' in title_text
                         or (
-                            'consommation' in CleanText('.')(title)
-                            and not Link('./td/a[contains(@id, "IdPopinLink")]', default=None)(tr)
+                            'consommation' in title_text
+                            and not LOAN_POPIN_LINK(tr)
                         )
                     ):
                         # Each row contains a `th` with a label and one `td` with the value
-                        value_xpath = './/div[contains(@id, "_IdDivDetail_")]//tr[contains(@id, "_Id%s_")]/td'
+                        value_xpath = self.LOAN_DETAIL_VALUE_XPATHS
                         account.total_amount = CleanDecimal.French(
-                            value_xpath % 'CapitalEmprunte',
+                            value_xpath['CapitalEmprunte'],
                             default=NotAvailable,
                         )(tr)
-                        account.rate = CleanDecimal.French(value_xpath % 'Taux', default=NotAvailable)(tr)
+                        account.rate = CleanDecimal.French(value_xpath['Taux'], default=NotAvailable)(tr)
                         account.opening_date = Date(
-                            CleanText(value_xpath % 'DateOuverture'),
+                            CleanText(value_xpath['DateOuverture']),
                             dayfirst=True,
                             default=NotAvailable,
                         )(tr)
                         account.subscription_date = Date(
-                            CleanText(value_xpath % 'DateSignature'),
+                            CleanText(value_xpath['DateSignature']),
                             dayfirst=True,
                             default=NotAvailable,
                         )(tr)
                         account.maturity_date = Date(
-                            CleanText(value_xpath % 'DerniereEcheance'),
+                            CleanText(value_xpath['DerniereEcheance']),
                             dayfirst=True,
                             default=NotAvailable,
                         )(tr)
                         account.next_payment_amount = CleanDecimal.French(
-                            value_xpath % 'MontantEcheance',
+                            value_xpath['MontantEcheance'],
                             default=NotAvailable,
                         )(tr)
                         account.next_payment_date = Date(
-                            CleanText(value_xpath % 'DateProchaineEcheance'),
+                            CleanText(value_xpath['DateProchaineEcheance']),
                             dayfirst=True,
                             default=NotAvailable,
                         )(tr)
 
-                    elif 'consommation' in CleanText('.')(title):
+                    elif 'consommation' in title_text:
                         form_params = self.prepare_form_cons_or_revolving(tr, 'conso')
                         self.submit_form(*form_params)
                         details_conso = self.browser.go_details_revolving_or_cons(loan_type='cons')
@@ -810,7 +940,7 @@ def get_loan_list(self):
                                     date = NotAvailable
                             setattr(account, k, date)
 
-                    elif 'renouvelables' in CleanText('.')(title):
+                    elif 'renouvelables' in title_text:
                         # To access the life insurance space, we need to delete the JSESSIONID cookie
                         # to avoid an expired session
                         # There might be duplicated JSESSIONID cookies (eg with different paths),
@@ -863,15 +993,13 @@ def get_partial_accounts_error_message(self):
         # > En raison d'un dysfonctionnement technique, une partie de vos
         # > contrats peut ne pas être visible. Nous nous attachons à les
         # > rendre visibles dans les meilleurs délais.
-        return CleanText(
-            '//div[@id="MM_SYNTHESE_CREDITS_divPopinInfoIndispo"]//p[1]',
-        )(self.doc)
+        return CleanText(self.PARTIAL_ACCOUNTS_ERROR_XPATH)(self.doc)
 
     def submit_conso_details(self):
         self.get_form(id='SAV_PP').submit()
 
     def go_levies(self, account_id=None):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
         if account_id:
             # Go to an account specific levies page
             eventargument = ""
@@ -902,7 +1030,7 @@ def go_levies(self, account_id=None):
 
     def go_list(self):
 
-        form = self.get_form(id='main')
+        form = self.get_main_form()
         eventargument = "CPTSYNT0"
 
         if "MM$m_CH$IsMsgInit" in form:
@@ -925,7 +1053,7 @@ def go_cards(self):
             self.logger.info("Do not try to go the CardsPage, there is not link on the main page")
             return
 
-        form = self.get_form(id='main')
+        form = self.get_main_form()
 
         eventargument = ""
 
@@ -943,21 +1071,21 @@ def go_cards(self):
 
     # only for old website
     def go_card_coming(self, eventargument):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
         eventtarget = "MM$HISTORIQUE_CB"
         scriptmanager = "m_ScriptManager|Menu_AJAX"
         self.submit_form(form, eventargument, eventtarget, scriptmanager)
 
     # only for new website
     def go_coming(self, eventargument):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
         eventtarget = "MM$HISTORIQUE_CB"
         scriptmanager = "MM$m_UpdatePanel|MM$HISTORIQUE_CB"
         self.submit_form(form, eventargument, eventtarget, scriptmanager)
 
     # On some pages, navigate to indexPage does not lead to the list of measures, so we need this form ...
     def go_measure_list(self):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
 
         form['__EVENTARGUMENT'] = "MESLIST0"
         form['__EVENTTARGET'] = 'Menu_AJAX'
@@ -969,7 +1097,7 @@ def go_measure_list(self):
 
     # This function goes to the accounts page of one measure giving its id
     def go_measure_accounts_list(self, measure_id):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
 
         form['__EVENTARGUMENT'] = "CPTSYNT0"
 
@@ -988,7 +1116,7 @@ def go_measure_accounts_list(self, measure_id):
         form.submit()
 
     def go_loan_list(self):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
 
         form['__EVENTARGUMENT'] = "CRESYNT0"
 
@@ -1005,7 +1133,7 @@ def go_loan_list(self):
         form.submit()
 
     def go_checkings(self):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
         form['__EVENTTARGET'] = 'MM$m_PostBack'
         form['__EVENTARGUMENT'] = 'CPTSYNT1'
 
@@ -1013,7 +1141,7 @@ def go_checkings(self):
         form.submit()
 
     def go_transfer_list(self):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
 
         form['__EVENTARGUMENT'] = 'HISVIR0&codeMenu=WVI3'
         form['__EVENTTARGET'] = 'MM$Menu_Ajax'
@@ -1044,12 +1172,12 @@ def is_history_of(self, account_id):
         Check whether the displayed history is for the correct account.
         If we do not find the select box we consider we are on the expected account (like it was before this check)
         """
-        if self.doc.xpath('//select[@id="MM_HISTORIQUE_COMPTE_m_ExDropDownList"]'):
-            return bool(self.doc.xpath('//option[@value="%s" and @selected]' % account_id))
+        if self.HISTORY_ACCOUNT_SELECT_XPATH(self.doc):
+            return bool(self.SELECTED_OPTION_XPATH(self.doc, id=account_id))
         return True
 
     def go_history(self, info, is_cbtab=False):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
 
         if is_cbtab:
             target = info['type']
@@ -1071,7 +1199,7 @@ def go_history_netpro(self, info, ):
         Even from a web browser the site does not work, and display the history of the first account
         We use a different post to go through and display the history we need
         """
-        form = self.get_form(id='main')
+        form = self.get_main_form()
         form['m_ScriptManager'] = 'MM$m_UpdatePanel|MM$HISTORIQUE_COMPTE$m_ExDropDownList'
         form['MM$HISTORIQUE_COMPTE$m_ExDropDownList'] = info['id']
         form['__EVENTTARGET'] = 'MM$HISTORIQUE_COMPTE$m_ExDropDownList'
@@ -1080,9 +1208,9 @@ def go_history_netpro(self, info, ):
         return form.submit()
 
     def get_form_to_detail(self, transaction):
-        m = re.match(r'.*\("(.*)", "(DETAIL_OP&[\d]+).*\)\)', transaction._link)
+        m = CARD_DETAIL_LINK_RE.match(transaction._link)
         # go to detailcard page
-        form = self.get_form(id='main')
+        form = self.get_main_form()
         form['__EVENTTARGET'] = m.group(1)
         form['__EVENTARGUMENT'] = m.group(2)
         fix_form(form)
@@ -1091,7 +1219,14 @@ def get_form_to_detail(self, transaction):
     def get_history(self):
         i = 0
         ignore = False
-        for tr in self.doc.xpath('//table[@cellpadding="1"]/tr') + self.doc.xpath('//tr[@class="rowClick" or @class="rowHover"]'):
+        parse_date = Date(dayfirst=True).filter
+        # The debit date of a card history is the same for every transaction of the page
+        card_debit_date = self.CARD_DEBIT_DATE_XPATH(self.doc)
+        debit_date = None
+        # Not a single XPath union: it would return the rows in document order
+        # and only once, while the header rows tracked by `ignore` rely on the
+        # old website rows coming first.
+        for tr in chain(self.OLD_WEBSITE_ROWS_XPATH(self.doc), self.HISTORY_ROWS_XPATH(self.doc)):
             tds = tr.findall('td')
 
             if len(tds) < 4:
@@ -1111,25 +1246,29 @@ def get_history(self):
                 continue
 
             # Remove useless details
-            detail = tr.xpath('.//div[has-class("detail")]')
-            if len(detail) > 0:
-                detail[0].drop_tree()
+            for div in tr.iter('div'):
+                if 'detail' in div.get('class', '').split():
+                    div.drop_tree()
+                    break
 
             t = Transaction()
 
             date = ''.join([txt.strip() for txt in tds[i + 0].itertext()])
             raw = ' '.join([txt.strip() for txt in tds[i + 1].itertext()])
-            debit = ''.join([txt.strip() for txt in tds[-2].itertext()])
-            credit = ''.join([txt.strip() for txt in tds[-1].itertext()])
+            # whitespace is dropped by clean_amount() anyway, so let libxml2
+            # serialize the amount cells instead of joining their text nodes
+            debit = etree.tostring(tds[-2], method='text', encoding='unicode', with_tail=False)
+            credit = etree.tostring(tds[-1], method='text', encoding='unicode', with_tail=False)
 
-            t.parse(date, re.sub(r'[ ]+', ' ', raw))
+            t.parse(date, SPACES_RE.sub(' ', raw))
 
-            card_debit_date = self.doc.xpath('//span[@id="MM_HISTORIQUE_CB_m_TableTitle3_lblTitle"] | //label[contains(text(), "débiter le")]')
             if card_debit_date:
-                t.rdate = t.bdate = Date(dayfirst=True).filter(date)
-                m = re.search(r'\b(\d{2}/\d{2}/\d{4})\b', card_debit_date[0].text)
-                assert m
-                t.date = Date(dayfirst=True).filter(m.group(1))
+                t.rdate = t.bdate = parse_date(date)
+                if debit_date is None:
+                    m = DEBIT_DATE_RE.search(card_debit_date[0].text)
+                    assert m
+                    debit_date = parse_date(m.group(1))
+                t.date = debit_date
 
             if t.date and t.rdate and abs(t.date.year - t.rdate.year) > 1:
                 # safety check in case we parsed a wrong rdate
@@ -1141,7 +1280,7 @@ def get_history(self):
                 t._link = Link(tr.xpath('./td/a'))(self.doc)
 
             # "Cb" for new site, "CB" for old one
-            mtc = re.match(r'(Cb|CB) (\d{4}\*+\d{6}) ', raw)
+            mtc = CARD_NUMBER_RE.match(raw)
             if mtc is not None:
                 t.card = mtc.group(2)
 
@@ -1153,16 +1292,16 @@ def get_history(self):
     def go_next(self):
         # <a id="MM_HISTORIQUE_CB_lnkSuivante" class="next" href="javascript:WebForm_DoPostBackWithOptions(new WebForm_PostBackOptions(&quot;MM$HISTORIQUE_CB$lnkSuivante&quot;, &quot;&quot;, true, &quot;&quot;, &quot;&quot;, false, true))">Suivant<span class="arrow">></span></a>
 
-        link = self.doc.xpath('//a[contains(@id, "lnkSuivante")]')
+        link = self.NEXT_PAGE_LINK_XPATH(self.doc)
         if len(link) == 0 or 'disabled' in link[0].attrib or link[0].attrib.get('class') == 'aspNetDisabled':
             return False
 
         account_type = 'COMPTE'
-        m = re.search(r'HISTORIQUE_(\w+)', link[0].attrib['href'])
+        m = HISTORY_ACCOUNT_TYPE_RE.search(link[0].attrib['href'])
         if m:
             account_type = m.group(1)
 
-        form = self.get_form(id='main')
+        form = self.get_main_form()
 
         form['__EVENTTARGET'] = "MM$HISTORIQUE_%s$lnkSuivante" % account_type
         form['__EVENTARGUMENT'] = ''
@@ -1181,12 +1320,9 @@ def go_life_insurance(self, account):
             return
 
         link = self.doc.xpath('//tr[td[contains(., ' + account.id + ') ]]//a')[0]
-        m = re.search(
-            r"PostBackOptions?\([\"']([^\"']+)[\"'],\s*['\"]((REDIR_ASS_VIE)?[\d\w&]+)?['\"]",
-            link.attrib.get('href', '')
-        )
+        m = LIFE_INSURANCE_POSTBACK_RE.search(link.attrib.get('href', ''))
         if m is not None:
-            form = self.get_form(id='main')
+            form = self.get_main_form()
 
             form['__EVENTTARGET'] = m.group(1)
             form['__EVENTARGUMENT'] = m.group(2)
@@ -1198,7 +1334,7 @@ def go_life_insurance(self, account):
             form.submit()
 
     def transfer_link(self):
-        return self.doc.xpath('//a[span[contains(text(), "Effectuer un virement")]] | //a[contains(text(), "Réaliser un virement")]')
+        return self.TRANSFER_LINK_XPATH(self.doc)
 
     def go_transfer_via_history(self, account):
         self.go_history(account._info)
@@ -1214,11 +1350,8 @@ def go_transfer_page(self):
             return False
         else:
             link = link[0]
-        m = re.search(
-            r"PostBackOptions?\([\"']([^\"']+)[\"'],\s*['\"]([^\"']+)?['\"]",
-            link.attrib.get('href', '')
-        )
-        form = self.get_form(id='main')
+        m = TRANSFER_POSTBACK_RE.search(link.attrib.get('href', ''))
+        form = self.get_main_form()
         if 'MM$HISTORIQUE_COMPTE$btnCumul' in form:
             del form['MM$HISTORIQUE_COMPTE$btnCumul']
         form['__EVENTTARGET'] = m.group(1)
@@ -1233,46 +1366,39 @@ def go_emitters(self):
         return self.go_transfer_page()
 
     def transfer_unavailable(self):
-        return CleanText(
-            '''//li[contains(text(), "Pour accéder à cette fonctionnalité, vous devez disposer d’un moyen d’authentification renforcée")]'''
-        )(self.doc)
+        return CleanText(self.TRANSFER_UNAVAILABLE_XPATH)(self.doc)
 
     def loan_unavailable_msg(self):
-        msg = CleanText('//span[@id="MM_LblMessagePopinError"] | //p[@id="MM_ERREUR_PAGE_BLANCHE_pAlert"]')(self.doc)
+        msg = CleanText(self.LOAN_UNAVAILABLE_XPATH)(self.doc)
         if msg:
             return msg
 
     def is_subscription_unauthorized(self):
-        return 'non autorisée' in CleanText('//div[@id="MM_ContentMain"]')(self.doc)
+        return 'non autorisée' in CleanText(self.CONTENT_MAIN_XPATH)(self.doc)
 
     def get_email_needed_message(self):
-        return CleanText(
-            '//span[contains(@id, "NonEligibleRenseignerEmail")]'
-        )(self.doc)
+        return CleanText(self.EMAIL_NEEDED_XPATH)(self.doc)
 
     def go_pro_transfer_availability(self):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
         form['__EVENTTARGET'] = 'Menu_AJAX'
         form['__EVENTARGUMENT'] = 'VIRLSRM0'
         form['m_ScriptManager'] = 'm_ScriptManager|Menu_AJAX'
         form.submit()
 
     def is_transfer_allowed(self):
-        return not self.doc.xpath('//ul/li[contains(text(), "Aucun compte tiers n\'est disponible")]')
+        return not self.NO_THIRD_PARTY_ACCOUNT_XPATH(self.doc)
 
     def levies_page_enabled(self):
         """ Levies page does not exist in the nav bar for every connections """
-        return (
-            CleanText('//a/span[contains(text(), "Suivre mes prélèvements reçus")]')(self.doc)  # new website
-            or CleanText('//a[contains(text(), "Suivre les prélèvements reçus")]')(self.doc)  # old website
-        )
+        return HasElement(self.LEVIES_LINK_XPATH)(self.doc)
 
     def get_trusted_device_url(self):
-        return Regexp(
-            CleanText('//script[contains(text(), "trusted-device")]'),
-            r'if\("([^"]+(?:trusted-device)[^"]+)"',
-            default=None,
-        )(self.doc)
+        for script in self.TRUSTED_DEVICE_SCRIPTS_XPATH(self.doc):
+            m = TRUSTED_DEVICE_URL_RE.search(script)
+            if m:
+                return m.group(1)
+        return None
 
     def get_unavailable_2fa_message(self):
         # The message might be too long, so we retrieve only the first part.
@@ -1284,10 +1410,9 @@ def get_unavailable_2fa_message(self):
 
 
 class TransactionPopupPage(LoggedPage, HTMLPage):
-    def is_here(self):
-        return CleanText(
-            '''//div[@class="scrollPane"]/table[//caption[contains(text(), "Détail de l'opération")]]'''
-        )(self.doc)
+    is_here = CleanText(etree.XPath(
+        '''//div[@class="scrollPane"]/table[//caption[contains(text(), "Détail de l'opération")]]'''
+    ))
 
     def complete_label(self):
         return CleanText(
@@ -1298,8 +1423,7 @@ def complete_label(self):
 class NewLeviesPage(IndexPage):
     """ Scrape new website 'Prélèvements' page for comings for checking accounts """
 
-    def is_here(self):
-        return CleanText('//h2[contains(text(), "Suivez vos prélèvements reçus")]')(self.doc)
+    is_here = HasElement(etree.XPath('//h2[contains(text(), "Suivez vos prélèvements reçus")]'))
 
     def comings_enabled(self, account_id):
         """ Check if a specific account can be selected on the general levies page """
@@ -1314,6 +1438,13 @@ class iter_coming(TableElement):
         col_coming = 'Montant'
         col_date = 'Date'
 
+        # The whole table is empty when there is no levy, no need to check it on each row
+        condition = HasElement(
+            etree.XPath('''//p[contains(text(), "Vous n'avez pas de prélèvement en attente d'exécution.")]'''),
+            yesvalue=False,
+            novalue=True,
+        )
+
         class item(ItemElement):
             klass = Transaction
 
@@ -1325,19 +1456,11 @@ class item(ItemElement):
             obj_amount = CleanDecimal.French(TableCell('coming'), sign=lambda x: -1)
             obj_date = Date(CleanText(TableCell('date')), dayfirst=True)
 
-            def condition(self):
-                return (
-                    not CleanText('''
-                        //p[contains(text(), "Vous n'avez pas de prélèvement en attente d'exécution.")]
-                    ''')(self)
-                )
-
 
 class OldLeviesPage(IndexPage):
     """ Scrape old website 'Prélèvements' page for comings for checking accounts """
 
-    def is_here(self):
-        return CleanText('//span[contains(text(), "Suivez vos prélèvements reçus")]')(self.doc)
+    is_here = HasElement(etree.XPath('//span[contains(text(), "Suivez vos prélèvements reçus")]'))
 
     def comings_enabled(self, account_id):
         """ Check if a specific account can be selected on the general levies page """
@@ -1352,6 +1475,15 @@ class iter_coming(TableElement):
         col_coming = 'Montant'
         col_date = 'Date'
 
+        # The whole table is empty when there is no levy, no need to check it on each row
+        condition = HasElement(
+            etree.XPath(
+                '''//table[@id="MM_SYNTHESE_SDD_RECUS_rpt_dgList_0"]//td[contains(text(), "Vous n'avez pas de prélèvements")]'''
+            ),
+            yesvalue=False,
+            novalue=True,
+        )
+
         class item(ItemElement):
             klass = Transaction
 
@@ -1363,15 +1495,9 @@ class item(ItemElement):
             obj_amount = CleanDecimal.French(TableCell('coming'), sign=lambda x: -1)
             obj_date = Date(CleanText(TableCell('date')), dayfirst=True)
 
-            def condition(self):
-                return not CleanText('''
-                    //table[@id="MM_SYNTHESE_SDD_RECUS_rpt_dgList_0"]//td[contains(text(), "Vous n'avez pas de prélèvements")]
-                ''')(self)
-
 
 class CardsPage(IndexPage):
-    def is_here(self):
-        return CleanText('//h3[normalize-space(text())="Mes cartes (cartes dont je suis le titulaire)"]')(self.doc)
+    is_here = HasElement(etree.XPath('//h3[normalize-space(text())="Mes cartes (cartes dont je suis le titulaire)"]'))
 
     @method
     class iter_cards(TableElement):
@@ -1399,18 +1525,20 @@ class item(ItemElement):
             obj__card_links = None
 
             def obj_coming(self):
-                if CleanText(TableCell('coming'))(self) == '-':
+                coming = CleanText(TableCell('coming'))(self)
+                if coming == '-':
                     raise SkipItem('immediate debit card?')
-                return CleanDecimal.French(TableCell('coming'), sign=lambda x: -1)(self)
+                return CleanDecimal.French(sign=lambda x: -1).filter(coming)
 
             def condition(self):
                 immediate_str = ''
+                options = CLEAN_CARD_OPTIONS(self.el)
                 # There are some card without any information. To exclude them, we keep only account
                 # with extra "option" (ex: coming transaction link, block bank card...)
-                if 'Faire opposition' in CleanText("./td[5]")(self):
+                if 'Faire opposition' in options:
                     # Only deferred card have this option to see coming transaction, even when
                     # there is 0 coming (Table element have no thead for the 5th column).
-                    if 'Consulter mon encours carte' in CleanText("./td[5]")(self):
+                    if 'Consulter mon encours carte' in options:
                         return True
 
                     # Card without 'Consulter mon encours carte' are immediate card. There are logged
@@ -1426,8 +1554,7 @@ def condition(self):
 
 
 class CardsComingPage(IndexPage):
-    def is_here(self):
-        return CleanText('//h2[text()="Encours de carte à débit différé"]')(self.doc)
+    is_here = HasElement(etree.XPath('//h2[text()="Encours de carte à débit différé"]'))
 
     @method
     class iter_cards(ListElement):
@@ -1437,35 +1564,26 @@ class item(ItemElement):
             klass = Account
 
             def obj_id(self):
-                # We must handle two kinds of Regexp because the 'X' are not
-                # located at the same level for sub-modules such as palatine
-                card_id = Regexp(
-                    CleanText(
-                        Field('label'),
-                        replace=[('*', 'X')]
-                    ),
-                    r'(\d{4}X{6}\d{6}|\d{6}X{6}\d{4})',
-                    default=NotAvailable
-                )(self)
+                # obj_label is already cleaned, plain str.replace is enough here
+                label = Field('label')(self)
+                m = CARD_COMING_ID_RE.search(label.replace('*', 'X'))
+                card_id = m.group(1) if m else NotAvailable
 
                 if Env('is_id_duplicate'):
                     # We can have multiple cards with the same card number, so now we use this regex to build our
                     # own id with the name of the concerned card user
                     # label are so inconsistent it overcomplexifies the regex to handle pronouns
                     # and a varied range of cards as well
-                    name = Regexp(
-                        CleanText(Field('label'), replace=[("'", " ")]),
-                        r"(Visa|VISA) (?:Classic|CLASSIC|Premier|PREMIER|Infinite|INFINITE|Platinum|PLATINUM|(Gold\s)*Business) (?:Izicarte )?((?:MME|ME|Mme|MR|M|M\.|MLLE|MLE|ML|LE|DD|N)?[a-zA-Zéèî,\- .]+) \d+[*]+\d+"
-                    )(self).replace(' ', '_')
+                    name = CARD_HOLDER_NAME.filter(
+                        CleanText(None, replace=[("'", " ")]).filter(label)
+                    ).replace(' ', '_')
                     return f'{card_id}_{name}'
 
                 return card_id
 
             def obj_number(self):
-                return Coalesce(
-                    Regexp(CleanText(Field('label')), r'(\d{6}\*{6}\d{4})', default=NotAvailable),
-                    Regexp(CleanText(Field('label')), r'(\d{4}\*{6}\d{6})', default=NotAvailable),
-                )(self)
+                m = CARD_COMING_NUMBER_RE.search(Field('label')(self))
+                return m.group(1) if m else NotAvailable
 
             obj_type = Account.TYPE_CARD
             obj_label = CleanText('./td[1]')
@@ -1479,7 +1597,7 @@ def is_id_duplicate(self):
             '//table[contains(@class, "compte") and position() = 1]//tr[contains(@id, "MM_HISTORIQUE_CB") and position() < last()]/td[1]',
             replace=[('*', 'X')]
         )(self.doc)
-        ids = re.findall(r'(\d{4,6}X{6}\d{4,6})', label)
+        ids = MASKED_CARD_NUMBER_RE.findall(label)
         return len(ids) != len(set(ids))
 
     def get_card_coming_info(self, number, info):
@@ -1501,7 +1619,7 @@ def get_card_coming_info(self, number, info):
         if CleanText('//a[contains(text(),"%s")]' % number)(self.doc):
             # For all cards except the first one for the same check account, we have to get info through their href info
             link = CleanText(Link('//a[contains(text(),"%s")]' % number))(self.doc)
-            infos = re.match(r'.*(DETAIL_OP_M\d&[^\"]+).*', link)
+            infos = CARD_COMING_LINK_RE.match(link)
             info['link'] = infos.group(1)
 
             return info
@@ -1509,20 +1627,27 @@ def get_card_coming_info(self, number, info):
 
 
 class CardsOldWebsitePage(IndexPage):
-    def is_here(self):
-        return CleanText('''
-            //span[@id="MM_m_CH_lblTitle" and contains(text(), "Historique de vos encours CB")]
-        ''')(self.doc)
+    is_here = HasElement(etree.XPath(
+        '//span[@id="MM_m_CH_lblTitle" and contains(text(), "Historique de vos encours CB")]'
+    ))
+
+    # Both are read for each card or transaction row but only depend on the page
+    _account_id = None
+    _coming_date = None
 
     def get_account(self):
-        infos = CleanText('.//span[@id="MM_HISTORIQUE_CB"]/table[position()=1]//td')(self.doc)
-        result = re.search(r'.*(\d{11}).*', infos)
-        return result.group(1)
+        if self._account_id is None:
+            infos = CleanText('.//span[@id="MM_HISTORIQUE_CB"]/table[position()=1]//td')(self.doc)
+            result = CARD_ACCOUNT_ID_RE.search(infos)
+            self._account_id = result.group(1)
+        return self._account_id
 
     def get_date(self):
-        title = CleanText('//span[@id="MM_HISTORIQUE_CB_m_TableTitle3_lblTitle"]')(self.doc)
-        title_date = re.match('.*le (.*) sur .*', title)
-        return Date(dayfirst=True).filter(title_date.group(1))
+        if self._coming_date is None:
+            title = CleanText('//span[@id="MM_HISTORIQUE_CB_m_TableTitle3_lblTitle"]')(self.doc)
+            title_date = CARD_COMING_TITLE_DATE_RE.match(title)
+            self._coming_date = Date(dayfirst=True).filter(title_date.group(1))
+        return self._coming_date
 
     @method
     class iter_cards(TableElement):
@@ -1555,7 +1680,7 @@ def obj_id(self):
 
             def obj__coming_eventargument(self):
                 url = Attr('.//a', 'href')(self)
-                res = re.match(r'.*(DETAIL_OP_M0\&.*;\d{8})", .*', url)
+                res = CARD_COMING_EVENTARGUMENT_RE.match(url)
                 return res.group(1)
 
         def parse(self, obj):
@@ -1617,11 +1742,12 @@ def is_error(self):
         return CleanText('//caption[contains(text(),"Erreur")]')(self.doc)
 
     def parse_decimal(self, td, percentage=False):
-        value = CleanText('.')(td)
+        value = CLEAN_TEXT(td)
         if value and value != '-':
+            value = Decimal(FrenchTransaction.clean_amount(value))
             if percentage:
-                return Decimal(FrenchTransaction.clean_amount(value)) / 100
-            return Decimal(FrenchTransaction.clean_amount(value))
+                return value / 100
+            return value
         else:
             return NotAvailable
 
@@ -1692,13 +1818,15 @@ def condition(self):
             obj_raw = Transaction.Raw(Dict('type/libelleLong'))
             obj_amount = Eval(float_to_decimal, Dict('montantBrut/valeur'))
 
-            def obj_date(self):
+            def parse(self, el):
+                # convert the timestamp once, it is used for all three dates
                 date = Dict('dateEffet')(self)
                 if date:
-                    return datetime.fromtimestamp(date / 1000)
-                return NotAvailable
+                    self.env['date'] = datetime.fromtimestamp(date / 1000)
+                else:
+                    self.env['date'] = NotAvailable
 
-            obj_vdate = obj_rdate = obj_date
+            obj_date = obj_vdate = obj_rdate = Env('date')
 
 
 class LifeInsuranceInvestments(LoggedPage, JsonPage):
@@ -1729,23 +1857,27 @@ def obj_vdate(self):
                 return NotAvailable
 
             def obj_quantity(self):
-                if Dict('nombreParts')(self):
-                    return Eval(float_to_decimal, Dict('nombreParts'))(self)
+                quantity = Dict('nombreParts')(self)
+                if quantity:
+                    return float_to_decimal(quantity)
                 return NotAvailable
 
             def obj_diff(self):
-                if Dict('montantPlusValue/valeur', default=None)(self):
-                    return Eval(float_to_decimal, Dict('montantPlusValue/valeur'))(self)
+                diff = Dict('montantPlusValue/valeur', default=None)(self)
+                if diff:
+                    return float_to_decimal(diff)
                 return NotAvailable
 
             def obj_diff_ratio(self):
-                if Dict('tauxPlusValue')(self):
-                    return Eval(lambda x: float_to_decimal(x) / 100, Dict('tauxPlusValue'))(self)
+                diff_ratio = Dict('tauxPlusValue')(self)
+                if diff_ratio:
+                    return float_to_decimal(diff_ratio) / 100
                 return NotAvailable
 
             def obj_unitvalue(self):
-                if Dict('cotation/montant')(self):
-                    return Eval(float_to_decimal, Dict('cotation/montant/valeur'))(self)
+                amount = Dict('cotation/montant')(self)
+                if amount:
+                    return float_to_decimal(Dict('valeur')(amount))
                 return NotAvailable
 
             obj_code = IsinCode(CleanText(Dict('codeIsin', default='')), default=NotAvailable)
@@ -1847,26 +1979,28 @@ def has_history(self):
 
 
 class MeasurePage(IndexPage):
-    def is_here(self):
-        return self.doc.xpath('//span[contains(text(), "Liste de vos mesures")]')
+    is_here = HasElement(etree.XPath('//span[contains(text(), "Liste de vos mesures")]'))
 
 
-class AuthentPage(LoggedPage, HTMLPage):
-    def is_here(self):
-        return bool(CleanText('//h2[contains(text(), "Authentification réussie")]')(self.doc))
+class AuthentPage(LoggedPage, HTMLPage, MainFormCache):
+    is_here = HasElement(etree.XPath('//h2[contains(text(), "Authentification réussie")]'))
 
     def go_on(self):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
         form['__EVENTTARGET'] = 'MM$RETOUR_OK_SOL$m_ChoiceBar$lnkRight'
         form.submit()
 
 
-class TransactionsDetailsPage(LoggedPage, HTMLPage):
+class TransactionsDetailsPage(LoggedPage, HTMLPage, MainFormCache):
+
+    is_here = HasElement(etree.XPath(
+        '//h2[contains(text(), "Débits différés imputés")] | //span[@id="MM_m_CH_lblTitle" and contains(text(), "Débit différé imputé")]'
+    ))
 
-    def is_here(self):
-        return bool(CleanText(
-            '//h2[contains(text(), "Débits différés imputés")] | //span[@id="MM_m_CH_lblTitle" and contains(text(), "Débit différé imputé")]'
-        )(self.doc))
+    # evaluated once per page of deferred card transactions
+    NEXT_PAGE_LINK_XPATH = etree.XPath(
+        '//a[contains(@id, "lnkSuivante") and not(contains(@disabled, "disabled")) and not(contains(@class, "aspNetDisabled"))]'
+    )
 
     @pagination
     @method
@@ -1881,11 +2015,8 @@ class get_detail(TableElement):
 
         def next_page(self):
             # only for new website, don't have any accounts with enough deferred card transactions on old webiste
-            if self.page.doc.xpath('''
-                //a[contains(@id, "lnkSuivante") and not(contains(@disabled,"disabled"))
-                    and not(contains(@class, "aspNetDisabled"))]
-            '''):
-                form = self.page.get_form(id='main')
+            if self.page.NEXT_PAGE_LINK_XPATH(self.page.doc):
+                form = self.page.get_main_form()
                 form['__EVENTTARGET'] = "MM$ECRITURE_GLOBALE$lnkSuivante"
                 form['__EVENTARGUMENT'] = ''
                 fix_form(form)
@@ -1906,23 +2037,22 @@ def obj_amount(self):
     def go_form_to_summary(self):
         # return to first page
         to_history = Link(self.doc.xpath('//a[contains(text(), "Retour à l\'historique")]'))(self.doc)
-        n = re.match(r'.*\([\'\"](MM\$.*?)[\'\"],.*\)$', to_history)
-        form = self.get_form(id='main')
+        n = HISTORY_EVENTTARGET_RE.match(to_history)
+        form = self.get_main_form()
         form['__EVENTTARGET'] = n.group(1)
         form.submit()
 
     def go_newsite_back_to_summary(self):
-        form = self.get_form(id='main')
+        form = self.get_main_form()
         form['__EVENTTARGET'] = "MM$ECRITURE_GLOBALE$lnkRetourHisto"
         form.submit()
 
 
-class ActivationSubscriptionPage(LoggedPage, HTMLPage, NoAccountCheck):
-    def is_here(self):
-        return CleanText('//span[contains(text(), "En activant le format numérique")]')(self.doc)
+class ActivationSubscriptionPage(LoggedPage, HTMLPage, NoAccountCheck, MainFormCache):
+    is_here = HasElement(etree.XPath('//span[contains(text(), "En activant le format numérique")]'))
 
     def send_check_no_accounts_form(self):
-        form = self.get_form(id="main")
+        form = self.get_main_form()
 
         form['__EVENTTARGET'] = 'MM$Menu_Ajax'
         form['__EVENTARGUMENT'] = 'ABOCPTI0&codeMenu=WPRO4'
@@ -21,6 +21,7 @@
 from io import BytesIO
 from decimal import Decimal
 from datetime import date, datetime
+from functools import lru_cache
 
 import chompjs
 from dateutil.tz import tz
@@ -44,7 +45,7 @@
     AccountOwnerType,
 )
 from woob.capabilities.bank.wealth import Investment
-from woob.capabilities.base import NotAvailable, empty
+from woob.capabilities.base import NotAvailable, NotLoaded, empty
 from woob.exceptions import (
     AppValidationCancelled, BrowserIncorrectPassword,
     BrowserPasswordExpired, BrowserUserBanned,
@@ -167,6 +168,8 @@ class AuthenticationMethodPage(JsonPage):
         '281': True,  # Seen for CLOUDCARD on Caisse d'Épargne
     }
 
+    _validation_unit = NotLoaded
+
     def get_validation_id(self):
         return Dict('id', default=NotAvailable)(self.doc)
 
@@ -198,13 +201,19 @@ def has_validation_unit(self):
         return self._safe_validation_units() is not None
 
     def _safe_validation_units(self):
-        units = Coalesce(
-            Dict('step/validationUnits', default=None),
-            Dict('validationUnits', default=None),
-            default=None
-        )(self.doc)
-        if units is not None and len(units) > 0:
-            return units[0]
+        # Cached for the page, code replacing self.doc has to reset
+        # _validation_unit to NotLoaded.
+        if self._validation_unit is NotLoaded:
+            units = Coalesce(
+                Dict('step/validationUnits', default=None),
+                Dict('validationUnits', default=None),
+                default=None
+            )(self.doc)
+            if units is not None and len(units) > 0:
+                self._validation_unit = units[0]
+            else:
+                self._validation_unit = None
+        return self._validation_unit
 
     @property
     def validation_unit_id(self):
@@ -257,9 +266,15 @@ def login_errors(self, error):
         if error == 'AUTHENTICATION_LOCKED':
             message = "L'accès à votre espace a été bloqué temporairement suite à plusieurs essais infructueux."
             if 'response' in self.doc and self.doc['response'].get('unlockingDate'):
-                unlocking_date = parse_date(
-                    self.doc['response']['unlockingDate']  # parse datetime, tz aware, on UTC
-                ).astimezone(tz.tzlocal())  # convert to our timezone
+                # ISO 8601 datetime on UTC
+                unlocking_date = self.doc['response']['unlockingDate']
+                try:
+                    # fromisoformat only understands the 'Z' suffix since python 3.11
+                    unlocking_date = datetime.fromisoformat(unlocking_date.replace('Z', '+00:00'))
+                except ValueError:
+                    # before python 3.11, it is also strict about fractions and offsets
+                    unlocking_date = parse_date(unlocking_date)
+                unlocking_date = unlocking_date.astimezone(tz.tzlocal())  # convert to our timezone
                 message = ' '.join([message, 'Vous pouvez réessayer à partir du %s' % unlocking_date])
             raise BrowserUserBanned(message)
         if error in ('FAILED_AUTHENTICATION', ):
@@ -331,7 +346,8 @@ def get_all_images_data(self):
         return self.doc
 
 
-class ValidationPageOption(LoggedPage, HTMLPage):
+class ValidationPageOption(LoggedPage, RawPage):
+    # Only used to know where we are during the SCA, its content is never read
     pass
 
 
@@ -417,25 +433,32 @@ def __init__(self, browser, images):
         code_to_filedata = {}
         for img_item in images:
             img_content = browser.location(img_item['uri']).content
-            img = Image.open(BytesIO(img_content))
-            img = img.filter(ImageFilter.UnsharpMask(
-                radius=2,
-                percent=150,
-                threshold=3,
-            ))
-            img = img.convert('L', dither=None)
-
-            def threshold(px):
-                if px < 20:
-                    return 0
-                return 255
-
-            img = Image.eval(img, threshold)
-            b = BytesIO()
-            img.save(b, format='PNG')
-            code_to_filedata[img_item['value']] = b.getvalue()
+            code_to_filedata[img_item['value']] = self.clean_image(img_content)
         super(CaissedepargneNewKeyboard, self).__init__(code_to_filedata)
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def clean_image(img_content):
+        # The same digit images are served again and again between login
+        # attempts, only the values they are mapped to change.
+        img = Image.open(BytesIO(img_content))
+        img = img.filter(ImageFilter.UnsharpMask(
+            radius=2,
+            percent=150,
+            threshold=3,
+        ))
+        img = img.convert('L', dither=None)
+
+        def threshold(px):
+            if px < 20:
+                return 0
+            return 255
+
+        img = Image.eval(img, threshold)
+        b = BytesIO()
+        img.save(b, format='PNG')
+        return b.getvalue()
+
 
 class Transaction(FrenchTransaction):
     PATTERNS = [
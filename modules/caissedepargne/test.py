@@ -17,9 +17,15 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this woob module. If not, see <http://www.gnu.org/licenses/>.
 
+from datetime import datetime, timezone
 
+from dateutil.tz import tz
+
+from woob.exceptions import BrowserUserBanned
 from woob.tools.test import BackendTest
 
+from .pages import AuthenticationMethodPage
+
 
 class CaisseEpargneTest(BackendTest):
     MODULE = 'caissedepargne'
@@ -29,3 +35,21 @@ def test_caisse_epargne(self):
         if len(l) > 0:
             a = l[0]
             list(self.backend.iter_history(a))
+
+    def test_login_errors_unlocking_date(self):
+        page = AuthenticationMethodPage.__new__(AuthenticationMethodPage)
+        expected = datetime(2023, 5, 18, 12, 34, 56, tzinfo=timezone.utc).astimezone(tz.tzlocal())
+        # unlockingDate is an ISO 8601 datetime on UTC, with or without milliseconds
+        for unlocking_date, microsecond in (
+            ('2023-05-18T12:34:56Z', 0),
+            ('2023-05-18T12:34:56.123Z', 123000),
+            ('2023-05-18T12:34:56.1234Z', 123400),
+            ('2023-05-18T12:34:56.123+00:00', 123000),
+        ):
+            page.doc = {'response': {'unlockingDate': unlocking_date}}
+            with self.assertRaises(BrowserUserBanned) as cm:
+                page.login_errors('AUTHENTICATION_LOCKED')
+            self.assertIn(
+                'Vous pouvez réessayer à partir du %s' % expected.replace(microsecond=microsecond),
+                str(cm.exception),
+            )
@@ -42,6 +42,12 @@
 from .base_pages import fix_form
 from .pages import IndexPage
 
+# Filters applied on each <option> of the transfer forms, built only once
+OPTION_ACCOUNT_NUMBER = Regexp(CleanText('.'), r'- (\d+)')
+# at least one digit
+OPTION_SHORT_ID = Regexp(CleanText('.'), r'- (\w+\d\w+)')
+OPTION_IBAN = Regexp(CleanText('.'), r'.* - ([A-Za-z0-9]*) -', default=NotAvailable)
+
 
 class CheckingPage(LoggedPage, HTMLPage):
     def is_here(self):
@@ -273,8 +279,7 @@ def parse(self, el):
                 # and the shorter account number inside the text content
                 # Ex.: 00087654321
                 long_id = value[1:]
-                # at least one digit
-                short_id = Regexp(CleanText('.'), r'- (\w+\d\w+)')(self)
+                short_id = OPTION_SHORT_ID(self)
 
                 accounts = list(self.page.browser.get_accounts_list())
                 try:
@@ -427,14 +432,14 @@ def is_here(self):
 
     def can_transfer(self, account):
         for o in self.doc.xpath('//select[@id="MM_VIREMENT_SAISIE_VIREMENT_ddlCompteDebiter"]/option'):
-            if Regexp(CleanText('.'), r'- (\d+)')(o) in account.id:
+            if OPTION_ACCOUNT_NUMBER(o) in account.id:
                 return True
 
     def get_origin_account_value(self, account):
         origin_value = [
             Attr('.', 'value')(o)
             for o in self.doc.xpath('//select[@id="MM_VIREMENT_SAISIE_VIREMENT_ddlCompteDebiter"]/option')
-            if Regexp(CleanText('.'), r'- (\d+)')(o) in account.id
+            if OPTION_ACCOUNT_NUMBER(o) in account.id
         ]
         assert len(origin_value) == 1, 'error during origin account matching'
         return origin_value[0]
@@ -446,7 +451,7 @@ def get_recipient_value(self, recipient):
             recipient_value = [
                 Attr('.', 'value')(option)
                 for option in self.doc.xpath(self.RECIPIENT_XPATH)
-                if Regexp(CleanText('.'), r'.* - ([A-Za-z0-9]*) -', default=NotAvailable)(option) == recipient.iban
+                if OPTION_IBAN(option) == recipient.iban
             ]
         elif recipient.category == 'Interne':
             for option in self.doc.xpath(self.RECIPIENT_XPATH):
@@ -190,16 +190,16 @@ def iter_accounts(self):
             'hashFromCookieMultibanque': '',
         })
 
+        # Cards are matched with their checking account using the account number,
+        # the first checking account found for a given number prefix wins.
+        checkings = {}
+        for account in accounts:
+            if account.type == Account.TYPE_CHECKING:
+                checkings.setdefault(account.number[:-5], account)
+
         for account in accounts:
             if account.type == Account.TYPE_CARD:
-                # Match the card with its checking account using the account number
-                account.parent = next(
-                    (account_ for account_ in accounts if (
-                        account_.type == Account.TYPE_CHECKING
-                        and account_.number[:-5] == account.number[:-5]
-                    )),
-                    None,
-                )
+                account.parent = checkings.get(account.number[:-5])
             if (
                 account.type in (Account.TYPE_CHECKING, Account.TYPE_SAVINGS)
                 and self.page.get_status() == 'OK'  # IbanPage is not available if transfers are not authorized
@@ -71,10 +71,7 @@ def __init__(self, browser, crypto, grid):
         self.codes = grid
 
     def check_color(self, pixel):
-        for p in pixel:
-            if p > 0xd0:
-                return False
-        return True
+        return max(pixel) <= 0xd0
 
     def get_string_code(self, string):
         res = []
@@ -20,6 +20,8 @@
 import re
 from decimal import Decimal
 
+from lxml import etree
+
 from woob.browser.elements import method, DictElement, ItemElement, TableElement, ListElement
 from woob.browser.filters.html import Attr, TableCell, HasElement, Link
 from woob.browser.filters.json import Dict
@@ -37,6 +39,13 @@
 from woob.tools.date import parse_french_date
 
 
+# Evaluated on each row of the WPS accounts and history tables
+ROW_CELLS_XPATH = etree.XPath('./td')
+BALANCE_CELL_XPATH = etree.XPath('./td[@class="cel3"]')
+CARD_CELL_XPATH = etree.XPath('./td[@class="cel1 decal"]')
+HISTORY_LINK_XPATH = etree.XPath('./td/a')
+
+
 def float_to_decimal(f):
     if empty(f):
         return NotAvailable
@@ -49,14 +58,19 @@ def is_website_unavailable(self):
 
 
 class LoginPage(HTMLPage):
+    # Filters applied on each cell of the virtual keyboard, built only once
+    VK_CELL_NUMBER = CleanText('.')
+    VK_CELL_DIGIT = Regexp(Attr('.', 'onclick'), r"\((\d), 'password'\)")
+
     def get_vk_password(self, password):
         # The virtual keyboard is a table with cells containing the VK's
         # displayed number and JS code with the transformed number
         # <td id="hoverable" class="hoverable" onclick="appendTextInputCalculator(0, 'password')" >5</td>
 
-        vk_dict = {}
-        for vk_cell in self.doc.xpath('//table[@id="calculator"]//td'):
-            vk_dict[CleanText('.')(vk_cell)] = Regexp(Attr('.', 'onclick'), r"\((\d), 'password'\)")(vk_cell)
+        vk_dict = {
+            self.VK_CELL_NUMBER(vk_cell): self.VK_CELL_DIGIT(vk_cell)
+            for vk_cell in self.doc.xpath('//table[@id="calculator"]//td')
+        }
         return ''.join(vk_dict[char] for char in password)
 
     def login(self, username, password):
@@ -172,6 +186,13 @@ def obj__url(self):
                     return '/redirect/igc/' + Field('id')(self)
 
 
+PERFORMANCE_HISTORY_KEYS = (
+    (1, 'perfSupportUnAn'),
+    (3, 'perfSupportTroisAns'),
+    (5, 'perfSupportCinqAns'),
+)
+
+
 class AccountDetailsPage(LoggedPage, JsonPage):
     def has_investments(self):
         return HasElement(Dict('contrat/listeSupports', default=NotAvailable))(self.doc)
@@ -247,12 +268,11 @@ class item(ItemElement):
 
             def obj_performance_history(self):
                 perfs = {}
-                if Dict('detailPerformance/perfSupportUnAn', default=None)(self):
-                    perfs[1] = Eval(lambda x: float_to_decimal(x) / 100, Dict('detailPerformance/perfSupportUnAn'))(self)
-                if Dict('detailPerformance/perfSupportTroisAns', default=None)(self):
-                    perfs[3] = Eval(lambda x: float_to_decimal(x) / 100, Dict('detailPerformance/perfSupportTroisAns'))(self)
-                if Dict('detailPerformance/perfSupportCinqAns', default=None)(self):
-                    perfs[5] = Eval(lambda x: float_to_decimal(x) / 100, Dict('detailPerformance/perfSupportCinqAns'))(self)
+                details = self.el.get('detailPerformance') or {}
+                for duration, key in PERFORMANCE_HISTORY_KEYS:
+                    perf = details.get(key)
+                    if perf:
+                        perfs[duration] = float_to_decimal(perf) / 100
                 return perfs
 
 
@@ -279,7 +299,7 @@ class item(ItemElement):
             obj_type = Transaction.TYPE_BANK
 
             def obj_amount(self):
-                amount = Eval(float_to_decimal, Dict('montant'))(self)
+                amount = float_to_decimal(Dict('montant')(self))
                 if Dict('negatif')(self):
                     return -amount
                 return amount
@@ -347,16 +367,16 @@ class item(ItemElement):
                 obj_label = Regexp(Field('_raw_label'), r"^(.*) N°")
                 obj_id = Regexp(Field('_raw_label'), r"N° ([\dA-Z]+)")
                 obj_number = Field('id')
-                obj_balance = CleanDecimal.French('./td[@class="cel3"]', default=NotAvailable)
-                obj_currency = Currency('./td[@class="cel3"]')
+                obj_balance = CleanDecimal.French(BALANCE_CELL_XPATH, default=NotAvailable)
+                obj_currency = Currency(BALANCE_CELL_XPATH)
                 obj__investments = []
 
                 def obj_type(self):
-                    if HasElement('./td[@class="cel1 decal"]')(self):
+                    if HasElement(CARD_CELL_XPATH)(self):
                         return Account.TYPE_CARD
                     return MapIn(Lower(Env('category_title')), WPS_ACCOUNT_TYPES)(self)
 
-                obj__history_url = Regexp(Attr('./td/a', 'onclick', default=NotAvailable), r"'(.*)'", default=NotAvailable)
+                obj__history_url = Regexp(Attr(HISTORY_LINK_XPATH, 'onclick', default=NotAvailable), r"'(.*)'", default=NotAvailable)
 
 
 class RibPage(LoggedPage, HTMLPage):
@@ -414,7 +434,7 @@ class item(ItemElement):
             klass = Transaction
 
             def condition(self):
-                return len(self.el.xpath('./td')) > 2
+                return len(ROW_CELLS_XPATH(self.el)) > 2
 
             obj_date = Date(CleanText(TableCell('date')), dayfirst=True)
             obj_rdate = Date(
@@ -445,7 +465,7 @@ class item(ItemElement):
             klass = Transaction
 
             def condition(self):
-                return len(self.el.xpath('./td')) > 2
+                return len(ROW_CELLS_XPATH(self.el)) > 2
 
             obj_label = CleanText(TableCell('label'))
             obj_rdate = Date(CleanText(TableCell('date')), dayfirst=True)
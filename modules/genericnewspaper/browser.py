@@ -39,3 +39,23 @@ def get_content(self, _id):
         self.location(_id)
         if self.page is not None:
             return self.page.get_article(_id)
+
+    def iter_contents(self, ids):
+        """
+        Same as get_content() for several articles, yielded in the same order.
+
+        Articles are downloaded and their pages built concurrently by the
+        session workers; each page is then loaded and read here, in order.
+        """
+        futures = [(_id, self.async_open(_id)) for _id in ids]
+        try:
+            for _id, future in futures:
+                self.load_response(future.result())
+                if self.page is not None:
+                    yield self.page.get_article(_id)
+                else:
+                    yield None
+        finally:
+            # Don't leave downloads queued if the caller stops early.
+            for _id, future in futures:
+                future.cancel()
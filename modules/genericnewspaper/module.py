@@ -40,8 +40,13 @@ class GenericNewspaperModule(Module):
     RSSID = None
     URL2ID = None
     RSSSIZE = 0
+    # Seconds during which a downloaded feed is reused by iter_threads().
+    FEED_TTL = 60
     BROWSER = GenericNewspaperBrowser
 
+    _feed_entries = None
+    _feed_date = 0
+
     def create_default_browser(self):
         return self.create_browser()
 
@@ -61,6 +66,9 @@ def get_thread(self, _id):
         if not thread:
             thread = Thread(id)
 
+        return self._fill_thread_content(thread, content)
+
+    def _fill_thread_content(self, thread, content):
         flags = Message.IS_HTML
         if thread.id not in self.storage.get('seen', default={}):
             flags |= Message.IS_UNREAD
@@ -83,8 +91,15 @@ def get_thread(self, _id):
             children=[])
         return thread
 
+    def _get_feed_entries(self):
+        now = time.monotonic()
+        if self._feed_entries is None or now - self._feed_date > self.FEED_TTL:
+            self._feed_entries = list(Newsfeed(self.RSS_FEED, GenericNewspaperModule.RSSID).iter_entries())
+            self._feed_date = now
+        return self._feed_entries
+
     def iter_threads(self):
-        for article in Newsfeed(self.RSS_FEED, GenericNewspaperModule.RSSID).iter_entries():
+        for article in self._get_feed_entries():
             thread = Thread(article.id)
             thread.title = article.title
             thread.date = article.datetime
@@ -96,10 +111,12 @@ def fill_thread(self, thread, fields):
         return t or thread
 
     def iter_unread_messages(self):
-        for thread in self.iter_threads():
-            if thread.id in self.storage.get('seen', default={}):
-                continue
-            self.fill_thread(thread, 'root')
+        seen = self.storage.get('seen', default={})
+        threads = [thread for thread in self.iter_threads() if thread.id not in seen]
+        contents = self.browser.iter_contents([thread.id for thread in threads])
+        for thread, content in zip(threads, contents):
+            if content is not None:
+                self._fill_thread_content(thread, content)
             for msg in thread.iter_all_messages():
                 yield msg
 
@@ -50,8 +50,10 @@ class KrakenModule(Module, CapBankTransferAddRecipient, CapCurrencyRate):
     )
 
     # kraken uses XBT instead of BTC, but we want to keep BTC in the responses
+    CURRENCY_ALIASES = {'BTC': 'XBT', 'XBT': 'BTC'}
+
     def convert_id(self, currency_id):
-        return {'BTC':'XBT','XBT':'BTC'}.get(currency_id, currency_id)
+        return self.CURRENCY_ALIASES.get(currency_id, currency_id)
 
     def create_default_browser(self):
         return self.create_browser(self.config)
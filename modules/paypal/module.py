@@ -47,5 +47,4 @@ def iter_accounts(self):
         return self.browser.get_accounts().values()
 
     def iter_history(self, account):
-        for history in self.browser.get_download_history(account):
-            yield history
+        yield from self.browser.get_download_history(account)
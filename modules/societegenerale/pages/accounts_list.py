@@ -600,9 +600,11 @@ def obj_raw(self):
 
 
 class CreditPage(LoggedPage, HTMLPage):
+    HISTORY_URL_RE = re.compile(r'setPrestationURL\("(.*)"\)')
+
     def get_history_url(self):
         redirection_script = CleanText('//script[contains(text(), "setPrestationURL")]')(self.doc)
-        history_link = re.search(r'setPrestationURL\("(.*)"\)', redirection_script)
+        history_link = self.HISTORY_URL_RE.search(redirection_script)
         if history_link:
             return history_link.group(1)
 
@@ -637,9 +639,11 @@ def obj_amount(self):
 
 
 class OldHistoryPage(LoggedPage, HTMLPage):
+    HISTORY_URL_RE = re.compile(r",'(/.*)',")
+
     def get_history_url(self):
         redirection = CleanText('//body/@onload')(self.doc)
-        history_link = re.search(r",'(/.*)',", redirection)
+        history_link = self.HISTORY_URL_RE.search(redirection)
         if history_link:
             return history_link.group(1)
 
@@ -952,13 +956,7 @@ def obj_code(self):
                         return code
                 return NotAvailable
 
-            def obj_code_type(self):
-                matches = re.findall(r'\w+', CleanText(TableCell('label')(self)[0].xpath('.//@title'))(self))
-                for match in matches:
-                    code_type = IsinType(default=None).filter(match)
-                    if code_type:
-                        return code_type
-                return NotAvailable
+            obj_code_type = IsinType(Field('code'))
 
 
 class PeaLiquidityPage(LoggedPage, HTMLPage):
@@ -3,8 +3,10 @@
 import pytest
 
 import requests
+import responses
 
-from woob.browser import Browser
+from woob.browser import Browser, PagesBrowser, URL
+from woob.browser.pages import RawPage
 
 
 @pytest.fixture(scope="function")
@@ -67,3 +69,46 @@ class BrowserVerifyPath(NoRetryBrowser):
 
         r = BrowserVerifyPath().open('https://self-signed.badssl.com/')
         assert r.status_code == 200
+
+
+class HookPage(RawPage):
+    def on_load(self):
+        self.browser.hooks.append(('load', self.url))
+
+    def on_leave(self):
+        self.browser.hooks.append(('leave', self.url))
+
+
+class HookBrowser(PagesBrowser):
+    BASEURL = 'https://woob.test/'
+
+    first = URL(r'first', HookPage)
+    second = URL(r'second', HookPage)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hooks = []
+
+
+@responses.activate
+def test_load_response():
+    responses.add(responses.GET, 'https://woob.test/first', body='first')
+    responses.add(responses.GET, 'https://woob.test/second', body='second')
+
+    browser = HookBrowser()
+    browser.first.go()
+
+    # open() doesn't change the current page.
+    response = browser.open('https://woob.test/second')
+    assert browser.first.is_here()
+
+    assert browser.load_response(response) is response
+    assert browser.response is response
+    assert browser.page is response.page
+    assert browser.url == 'https://woob.test/second'
+    assert browser.second.is_here()
+    assert browser.hooks == [
+        ('load', 'https://woob.test/first'),
+        ('leave', 'https://woob.test/first'),
+        ('load', 'https://woob.test/second'),
+    ]
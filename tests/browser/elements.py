@@ -15,12 +15,16 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with woob. If not, see <http://www.gnu.org/licenses/>.
 
+import re
 from unittest import TestCase
 
-from woob.browser.elements import DictElement, ItemElement, method
+from lxml import etree
+
+from woob.browser.elements import DictElement, ItemElement, ListElement, TableElement, method
 from woob.browser.filters.json import Dict
+from woob.browser.filters.html import TableCell
 from woob.browser.filters.standard import CleanText, Eval
-from woob.browser.pages import JsonPage
+from woob.browser.pages import HTMLPage, JsonPage
 from woob.capabilities.base import BaseObject, StringField
 from woob.tools.json import json
 
@@ -153,3 +157,131 @@ class iter_other_objects(DictElement):
 
         objects = list(page.iter_other_objects())
         assert len(objects) == 0
+
+    def test_use_compiled_xpath_in_item_filters(self):
+        """Use a compiled XPath expression as the selector of item filters."""
+        class MyObject(BaseObject):
+            label = StringField('Label of the object')
+
+        class MyResponse:
+            pass
+
+        response = MyResponse()
+        response.url = 'https://example.org/objects'
+        response.headers = {
+            'content-type': 'text/html; charset=utf-8',
+        }
+        response.encoding = 'utf-8'
+        response.content = b"""<html><body><table>
+            <tr><td>1</td><td> hello </td></tr>
+            <tr><td>2</td><td>world</td></tr>
+        </table></body></html>"""
+
+        class MyBrowser:
+            pass
+
+        browser = MyBrowser()
+        browser.logger = None
+
+        class MyPage(HTMLPage):
+            @method
+            class iter_objects(ListElement):
+                item_xpath = '//tr'
+
+                class item(ItemElement):
+                    klass = MyObject
+
+                    obj_id = CleanText(etree.XPath('./td[1]'))
+                    obj_label = CleanText(etree.XPath('./td[2]'))
+
+        page = MyPage(browser, response)
+        objects = list(page.iter_objects())
+        assert len(objects) == 2
+        assert objects[0].id == '1'
+        assert objects[0].label == 'hello'
+        assert objects[1].id == '2'
+        assert objects[1].label == 'world'
+
+    def test_table_element_columns(self):
+        """Match table columns by heading, with colspan, for several tables and subclasses."""
+        class MyObject(BaseObject):
+            label = StringField('Label of the object')
+            amount = StringField('Amount of the object')
+
+        class MyResponse:
+            pass
+
+        def make_response(content):
+            response = MyResponse()
+            response.url = 'https://example.org/objects'
+            response.headers = {
+                'content-type': 'text/html; charset=utf-8',
+            }
+            response.encoding = 'utf-8'
+            response.content = content.encode('utf-8')
+            return response
+
+        class MyBrowser:
+            pass
+
+        browser = MyBrowser()
+        browser.logger = None
+
+        class MyPage(HTMLPage):
+            @method
+            class iter_objects(TableElement):
+                head_xpath = '//thead//th'
+                item_xpath = '//tbody/tr'
+
+                col_id = 'Reference'
+                col_label = ['Label', 'Libellé']
+                col_amount = re.compile(r'Amount \(.*\)')
+
+                class item(ItemElement):
+                    klass = MyObject
+
+                    obj_id = CleanText(TableCell('id'))
+                    obj_label = CleanText(TableCell('label'))
+                    obj_amount = CleanText(TableCell('amount'))
+
+        class OtherPage(MyPage):
+            @method
+            class iter_objects(MyPage.iter_objects.klass):
+                # override a parent column, others are inherited
+                col_label = 'Description'
+
+        # Headings are matched case insensitively and a colspan shifts the
+        # following columns.
+        page = MyPage(browser, make_response("""<html><body><table>
+            <thead><tr><th>REFERENCE</th><th colspan="2">Libellé</th><th>Amount (EUR)</th></tr></thead>
+            <tbody>
+                <tr><td>1</td><td>hello</td><td>ignored</td><td>10</td></tr>
+                <tr><td>2</td><td>world</td><td>ignored</td><td>20</td></tr>
+            </tbody>
+        </table></body></html>"""))
+        objects = list(page.iter_objects())
+        assert [(obj.id, obj.label, obj.amount) for obj in objects] == [
+            ('1', 'hello', '10'),
+            ('2', 'world', '20'),
+        ]
+
+        # The same element on a table with other positions and a column that
+        # appears twice, only its first occurrence is used.
+        page = MyPage(browser, make_response("""<html><body><table>
+            <thead><tr><th>Amount (USD)</th><th>Label</th><th>Reference</th><th>Label</th></tr></thead>
+            <tbody><tr><td>30</td><td>foo</td><td>3</td><td>bar</td></tr></tbody>
+        </table></body></html>"""))
+        objects = list(page.iter_objects())
+        assert [(obj.id, obj.label, obj.amount) for obj in objects] == [('3', 'foo', '30')]
+
+        # A subclass uses its own column headings, not the parent's ones.
+        page = OtherPage(browser, make_response("""<html><body><table>
+            <thead><tr><th>Label</th><th>Reference</th><th>Description</th><th>Amount (EUR)</th></tr></thead>
+            <tbody><tr><td>foo</td><td>4</td><td>bar</td><td>40</td></tr></tbody>
+        </table></body></html>"""))
+        objects = list(page.iter_objects())
+        assert [(obj.id, obj.label, obj.amount) for obj in objects] == [('4', 'bar', '40')]
+
+        # ...and the parent is not affected by the subclass.
+        objects = list(MyPage(browser, page.response).iter_objects())
+        assert [(obj.id, obj.label, obj.amount) for obj in objects] == [('4', 'foo', '40')]
@@ -0,0 +1,47 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+from woob.browser.pages import HTMLPage
+
+
+class MyResponse:
+    url = 'https://example.org/page'
+    headers = {'content-type': 'text/html; charset=iso-8859-1'}
+    encoding = 'iso-8859-1'
+    content = '<html><body><p id="label">Relevé</p></body></html>'.encode('iso-8859-1')
+
+
+class MyBrowser:
+    logger = None
+
+
+def test_html_page_parser_options():
+    """PARSER_OPTIONS are given to the lxml parser, decoding is unchanged."""
+    class DefaultPage(HTMLPage):
+        pass
+
+    class NoIdsPage(HTMLPage):
+        PARSER_OPTIONS = {'collect_ids': False, 'huge_tree': True}
+
+    page = DefaultPage(MyBrowser(), MyResponse())
+    assert page.doc.xpath('id("label")/text()') == ['Relevé']
+
+    page = NoIdsPage(MyBrowser(), MyResponse())
+    # the id lookup table isn't built...
+    assert page.doc.xpath('id("label")') == []
+    # ...but the document is parsed the same way
+    assert page.doc.xpath('//p[@id="label"]/text()') == ['Relevé']
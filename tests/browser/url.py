@@ -183,6 +183,65 @@ class MyBrowser(PagesBrowser):
     assert not browser.my_other_url.match('https://example.org/1/mypath')
 
 
+def test_match_same_pattern_several_bases():
+    """A relative pattern is matched against the base of each browser and
+    URL instance, even when the same pattern is shared between them.
+    """
+    class FirstBrowser(PagesBrowser):
+        BASEURL = 'https://first.example.org/'
+        OTHER_BASEURL = 'https://other.example.org/app/'
+
+        accounts = URL(r'/accounts/(?P<id>\d+)')
+        accounts_or_cards = URL(r'/cards/(?P<id>\d+)', r'/accounts/(?P<id>\d+)')
+        other_accounts = URL(r'accounts/(?P<id>\d+)', base='OTHER_BASEURL')
+        absolute = URL(r'https://absolute.example.org/accounts/(?P<id>\d+)')
+
+    class SecondBrowser(PagesBrowser):
+        BASEURL = 'https://second.example.org/'
+
+        accounts = URL(r'/accounts/(?P<id>\d+)')
+        absolute = URL(r'https://absolute.example.org/accounts/(?P<id>\d+)')
+
+    first = FirstBrowser()
+    second = SecondBrowser()
+
+    # Interleave calls so that a pattern cached for one base can't be
+    # reused for another one.
+    for _ in range(2):
+        assert first.accounts.match('https://first.example.org/accounts/1')['id'] == '1'
+        assert not first.accounts.match('https://second.example.org/accounts/1')
+        assert second.accounts.match('https://second.example.org/accounts/2')['id'] == '2'
+        assert not second.accounts.match('https://first.example.org/accounts/2')
+
+        assert first.accounts_or_cards.match('https://first.example.org/accounts/3')['id'] == '3'
+        assert first.accounts_or_cards.match('https://first.example.org/cards/4')['id'] == '4'
+        assert not first.accounts_or_cards.match('https://second.example.org/cards/4')
+
+        assert first.other_accounts.match('https://other.example.org/app/accounts/5')['id'] == '5'
+        assert not first.other_accounts.match('https://first.example.org/accounts/5')
+
+        # The base given to match() takes precedence over the browser's one.
+        assert first.accounts.match('https://second.example.org/accounts/6', base='https://second.example.org/')
+        assert not first.accounts.match('https://first.example.org/accounts/6', base='https://second.example.org/')
+
+        # Absolute patterns don't depend on the base.
+        for browser in (first, second):
+            assert browser.absolute.match('https://absolute.example.org/accounts/7')['id'] == '7'
+            assert not browser.absolute.match('https://first.example.org/accounts/7')
+
+        assert first.accounts.build(id=1) == 'https://first.example.org/accounts/1'
+        assert first.accounts_or_cards.build(id=3) == 'https://first.example.org/cards/3'
+        assert first.other_accounts.build(id=5) == 'https://other.example.org/app/accounts/5'
+        assert second.accounts.build(id=2) == 'https://second.example.org/accounts/2'
+
+    # Changing the base of a browser at runtime is taken into account.
+    first.BASEURL = 'https://new.example.org/'
+    assert first.accounts.match('https://new.example.org/accounts/8')['id'] == '8'
+    assert not first.accounts.match('https://first.example.org/accounts/8')
+    assert first.accounts.build(id=8) == 'https://new.example.org/accounts/8'
+    assert second.accounts.match('https://second.example.org/accounts/9')
+
+
 @responses.activate
 def test_response_method_matching():
     responses.add(
@@ -1070,6 +1070,25 @@ def location(self, *args, **kwargs) -> requests.Response:
 
         response = self.open(*args, **kwargs)
 
+        return self._set_location(response)
+
+    def load_response(self, response: requests.Response) -> requests.Response:
+        """
+        Set an already fetched response as the current one, like
+        :meth:`location` does after opening the URL.
+
+        This is useful to go on a page obtained with :meth:`open`, for
+        instance with ``is_async=True``.
+
+        >>> browser.load_response(browser.async_open(url).result()) # doctest: +SKIP
+        """
+        if self.page is not None:
+            # Call leave hook.
+            self.page.on_leave()
+
+        return self._set_location(response)
+
+    def _set_location(self, response: requests.Response) -> requests.Response:
         self.response = response
         self.page = response.page
         self.url = response.url
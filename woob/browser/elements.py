@@ -553,14 +553,7 @@ def __init__(self, *args, **kwargs):
 
         self._cols = {}
 
-        columns = {}
-        for attrname in dir(self):
-            m = re.match('col_(.*)', attrname)
-            if m:
-                cols = getattr(self, attrname)
-                if not isinstance(cols, (list,tuple)):
-                    cols = [cols]
-                columns[m.group(1)] = [s.lower() if isinstance(s, str) else s for s in cols]
+        columns = self._get_columns()
 
         colnum = 0
         for el in self.el.xpath(self.head_xpath):
@@ -576,6 +569,23 @@ def __init__(self, *args, **kwargs):
             except (ValueError, AttributeError):
                 colnum += 1
 
+    @classmethod
+    def _get_columns(cls):
+        # col_* attributes are declared on the class, so they are only
+        # collected once per class instead of once per parsed table.
+        columns = cls.__dict__.get('_columns')
+        if columns is None:
+            columns = {}
+            for attrname in dir(cls):
+                m = re.match('col_(.*)', attrname)
+                if m:
+                    cols = getattr(cls, attrname)
+                    if not isinstance(cols, (list,tuple)):
+                        cols = [cols]
+                    columns[m.group(1)] = [s.lower() if isinstance(s, str) else s for s in cols]
+            cls._columns = columns
+        return columns
+
     def get_colnum(self, name):
         return self._cols.get(name, None)
 
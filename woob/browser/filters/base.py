@@ -17,6 +17,7 @@
 
 from functools import wraps
 
+import lxml.etree
 import lxml.html
 
 from woob.exceptions import ParseError
@@ -170,6 +171,10 @@ def select(self, selector, item):
             selector._key = self._key
             selector._obj = self._obj
             ret = selector(item)
+        elif isinstance(selector, lxml.etree.XPath):
+            # A compiled expression can't be evaluated on an ItemElement
+            # like item.xpath(), only on the element it wraps.
+            ret = selector(getattr(item, 'el', item))
         elif callable(selector):
             ret = selector(item)
         else:
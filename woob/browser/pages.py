@@ -622,6 +622,12 @@ class HTMLPage(Page):
     Make links URLs absolute.
     """
 
+    PARSER_OPTIONS: ClassVar[Dict[str, Any]] = {}
+    """
+    Extra keyword arguments given to :class:`lxml.html.HTMLParser` when
+    building the document, for example ``{'huge_tree': True}``.
+    """
+
     def __init__(self, *args, **kwargs):
         self.setup_xpath_functions()
         super().__init__(*args, **kwargs)
@@ -737,7 +743,7 @@ def build_doc(self, content: bytes) -> lxml.etree._ElementTree:
         if encoding:
             encoding = encoding.replace('iso8859_', 'iso8859-')
         import lxml.html as html
-        parser = html.HTMLParser(encoding=encoding)
+        parser = html.HTMLParser(encoding=encoding, **self.PARSER_OPTIONS)
         doc = html.parse(BytesIO(content), parser, base_url=self.url)
 
         if self.ABSOLUTE_LINKS:
@@ -17,7 +17,7 @@
 
 from __future__ import annotations
 
-from functools import wraps
+from functools import lru_cache, wraps
 import re
 from typing import Callable, Dict, Optional, TYPE_CHECKING, Tuple, Type, TypeVar
 from urllib.parse import unquote
@@ -36,6 +36,19 @@
 URLType = TypeVar('URLType', bound='URL')
 
 
+@lru_cache(maxsize=1024)
+def _compile_url_pattern(regex: str, base: str | None = None) -> re.Pattern:
+    """
+    Compile an URL pattern, prefixed with ``base`` if it is relative.
+
+    :meth:`URL.match` is called for each URL of the browser on every
+    response, so the prefixed patterns are only built once.
+    """
+    if base is not None:
+        regex = re.escape(base).rstrip('/') + '/' + regex.lstrip('/')
+    return re.compile(regex)
+
+
 class UrlNotResolvable(Exception):
     """
     Raised when trying to locate on an URL instance which url pattern is not resolvable as a real url.
@@ -328,13 +341,15 @@ def match(
         Returns ``None`` if none matches.
         """
         for regex in self.urls:
-            if not ABSOLUTE_URL_PATTERN_RE.match(regex):
+            if ABSOLUTE_URL_PATTERN_RE.match(regex):
+                pattern = _compile_url_pattern(regex)
+            else:
                 if not base:
                     base = self.get_base_url(browser=None, for_pattern=regex)
 
-                regex = re.escape(base).rstrip('/') + '/' + regex.lstrip('/')
+                pattern = _compile_url_pattern(regex, base)
 
-            m = re.match(regex, url)
+            m = pattern.match(url)
             if m:
                 return m
 